@@ -1,4 +1,5 @@
 import asyncio
+import atexit
 import base64
 import glob
 import json
@@ -43,6 +44,8 @@ os.makedirs(RESPONSE_HISTORY_DIR, exist_ok=True)
 
 playback_queue = Queue()
 head_move_queue = Queue()
+save_queue = Queue()
+_save_thread = None
 playback_done_event = threading.Event()
 _playback_thread = None
 last_played_time = time.time()
@@ -259,7 +262,7 @@ def save_audio_to_wav(audio_bytes, filename):
     print(f"🎨 Saved response audio to {full_path}")
 
 
-def rotate_and_save_response_audio(audio_bytes):
+def _rotate_and_save(audio_bytes):
     # Rotate old files first (2 -> 3, 1 -> 2)
     for i in range(2, 0, -1):
         src = os.path.join(RESPONSE_HISTORY_DIR, f"response-{i}.wav")
@@ -270,6 +273,42 @@ def rotate_and_save_response_audio(audio_bytes):
     save_audio_to_wav(audio_bytes, "response-1.wav")
 
 
+def save_worker():
+    # Saves are batched: everything queued since the last pass is written in
+    # one go, and only the newest three survive the rotation anyway
+    while True:
+        batch = [save_queue.get()]
+        while not save_queue.empty():
+            batch.append(save_queue.get_nowait())
+        try:
+            for audio_bytes in batch[-3:]:
+                _rotate_and_save(audio_bytes)
+        except Exception as e:
+            print(f"❌ Failed to save response audio: {e}")
+        finally:
+            for _ in batch:
+                save_queue.task_done()
+
+
+def rotate_and_save_response_audio(audio_bytes):
+    # The rotation and WAV write happen on a background thread, so the
+    # caller's event loop isn't blocked on disk I/O
+    global _save_thread
+    if not _save_thread or not _save_thread.is_alive():
+        _save_thread = threading.Thread(target=save_worker, daemon=True)
+        _save_thread.start()
+    save_queue.put(bytes(audio_bytes))  # Callers reuse their buffers
+
+
+def _flush_saves():
+    # The save thread is a daemon, so wait for queued clips before exiting
+    if _save_thread and _save_thread.is_alive():
+        save_queue.join()
+
+
+atexit.register(_flush_saves)
+
+
 def handle_incoming_audio_chunk(audio_b64, buffer):
     audio_chunk = base64.b64decode(audio_b64)
     buffer.extend(audio_chunk)
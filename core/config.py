@@ -1,165 +1,287 @@
 import asyncio
-import configparser
+import contextlib
+import functools
+import json
 import os
-from dataclasses import dataclass
-from typing import Optional
-
-from dotenv import load_dotenv
+import sys
+from dataclasses import dataclass, fields, is_dataclass, replace
+from types import MappingProxyType
 
+from . import personality, prompts
 from .personality import (
     PersonalityProfile,
+    load_persona_ini,
     load_traits_from_ini,
 )
+from .prompts import BASE_INSTRUCTIONS
+
 
 # === Paths ===
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 ENV_PATH = os.path.join(ROOT_DIR, ".env")
 PERSONA_PATH = os.path.join(ROOT_DIR, "persona.ini")
+ENV_CACHE_PATH = os.path.join(ROOT_DIR, ".env.cache")
+
+
+def _fast_load_env(path, cache_path=ENV_CACHE_PATH):
+    """Apply .env to os.environ like load_dotenv(), reusing the values parsed on a
+    previous start for as long as the file is unchanged."""
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        return
+    key = [stat.st_mtime_ns, stat.st_size]
+
+    values = None
+    try:
+        with open(cache_path) as f:
+            cached = json.load(f)
+        if cached["key"] == key:
+            values = cached["values"]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+
+    if values is None:
+        from dotenv import dotenv_values
+
+        values = {k: v for k, v in dotenv_values(path).items() if v is not None}
+        # The cache holds the same secrets as .env, so keep it private to the user
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        try:
+            fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w") as f:
+                json.dump({"key": key, "values": values}, f)
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+
+    # Like load_dotenv(), never override variables that are already set
+    for k, v in values.items():
+        os.environ.setdefault(k, v)
+
 
 # === Load .env ===
-load_dotenv(dotenv_path=ENV_PATH)
+_fast_load_env(ENV_PATH)
+
+# Snapshot the environment once; every setting below is read from this dict.
+_ENV = os.environ.copy()
+
+
+def _env(key, default=None):
+    return _ENV.get(key, default)
+
+
+def _first_env(*keys, default=None):
+    """Return the first non-empty value among ``keys``, else ``default``."""
+    return next((v for k in keys if (v := _ENV.get(k))), default)
+
+
+_TRUE = frozenset({"1", "true", "yes", "on"})
+
+
+def _bool_env(key, default=False):
+    value = _env(key)
+    return default if value is None else value.strip().lower() in _TRUE
+
+
+def _lower_env(key, default):
+    return _env(key, default).strip().lower()
+
+
+def _int_env(key, default):
+    value = _env(key)
+    if value is None:
+        return default
+    value = value.strip()
+    digits = value[1:] if value.startswith("-") else value
+    return int(value) if digits.isdecimal() else default
+
+
+def _float_env(key, default):
+    value = _env(key)
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        return default
 
-# === Load traits.ini ===
-traits = load_traits_from_ini(PERSONA_PATH)
+
+# === Load persona.ini (parsed once, shared by traits and instructions) ===
+_config = load_persona_ini(PERSONA_PATH)
+traits = load_traits_from_ini(PERSONA_PATH, _config)
 
 # === Build Personality ===
 PERSONALITY = PersonalityProfile(**traits)
 
-_config = configparser.ConfigParser()
-_config.read(PERSONA_PATH)
-
-# === Instructions for GPT ===
-BASE_INSTRUCTIONS = """
-You also have special powers:
-- If someone asks if you like fishsticks you answer Yes. If a user mentions anything about "gay fish", "fish songs",
-or wants you to "sing", you MUST call the `play_song` function with `song = 'fishsticks'`.
-- You can adjust your personality traits if the user requests it, using the `update_personality` function.
-- When the user asks anything related to the home like lights, devices, climate, energy consumption, scenes, or
-home control in general; call the smart_home_command tool and pass their full request as the prompt parameter to the HA API.
-You will get a response back from Home Assistant itself so you have to interpret and explain it to the end user.
-
-You are allowed to call tools mid-conversation to trigger special behaviors.
-
-DO NOT explain or confirm that you are triggering a tool. Just smoothly integrate it.
-"""
-
-EXTRA_INSTRUCTIONS = _config.get("META", "instructions")
-if _config.has_section("BACKSTORY"):
-    BACKSTORY = dict(_config.items("BACKSTORY"))
-    BACKSTORY_FACTS = "\n".join([
-        f"- {key}: {value}" for key, value in BACKSTORY.items()
-    ])
+# === Instructions for GPT (BASE_INSTRUCTIONS lives in core/prompts.py) ===
+EXTRA_INSTRUCTIONS = _config["META"]["instructions"]
+BACKSTORY = dict(_config["BACKSTORY"]) if "BACKSTORY" in _config else {}
+if BACKSTORY:
+    BACKSTORY_FACTS = "\n".join(f"- {key}: {value}" for key, value in BACKSTORY.items())
 else:
-    BACKSTORY = {}
     BACKSTORY_FACTS = (
         "You are an enigma and nobody knows anything about you because the person "
         "talking to you hasn't configured your backstory. You might remind them to do "
         "that."
     )
 
-INSTRUCTIONS = (
-    BASE_INSTRUCTIONS.strip()
-    + "\n\n"
-    + EXTRA_INSTRUCTIONS.strip()
-    + "\n\n"
-    + "Known facts about your past:\n"
-    + BACKSTORY_FACTS
-    + "\n\n"
-    + PERSONALITY.generate_prompt()
-)
+
+def _compose_instructions() -> str:
+    return "\n\n".join(
+        part
+        for part in (
+            BASE_INSTRUCTIONS.strip(),
+            EXTRA_INSTRUCTIONS.strip(),
+            "Known facts about your past:\n" + BACKSTORY_FACTS,
+            PERSONALITY.generate_prompt(),
+        )
+        if part
+    )
+
+
+def _instructions_mtime() -> float:
+    """Newest mtime of the files INSTRUCTIONS is composed from."""
+    return max(
+        os.path.getmtime(path)
+        for path in (PERSONA_PATH, prompts.__file__, personality.__file__, __file__)
+    )
+
+
+@functools.cache
+def _instructions() -> str:
+    """Return the full instructions; exposed lazily as INSTRUCTIONS.
+
+    Uses the literal frozen by setup/freeze_prompts.py when it is up to date with
+    persona.ini and the prompt sources, and composes them otherwise.
+    """
+    try:
+        from ._instructions import INSTRUCTIONS, __mtime__
+    except ImportError:
+        __mtime__ = None
+    if __mtime__ != _instructions_mtime():
+        INSTRUCTIONS = _compose_instructions()
+    return sys.intern(INSTRUCTIONS)
+
 
 # === OpenAI Config (EXISTING - UNCHANGED) ===
-OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
-OPENAI_MODEL = os.getenv("OPENAI_MODEL", "gpt-4o-mini-realtime-preview")
-VOICE = os.getenv("VOICE", "ash")
+OPENAI_API_KEY = _env("OPENAI_API_KEY", "")
+OPENAI_MODEL = _env("OPENAI_MODEL", "gpt-4o-mini-realtime-preview")
+VOICE = _env("VOICE", "ash")
 
 # === Modes ===
-DEBUG_MODE = os.getenv("DEBUG_MODE", "true").lower() == "true"
-DEBUG_MODE_INCLUDE_DELTA = (
-    os.getenv("DEBUG_MODE_INCLUDE_DELTA", "false").lower() == "true"
-)
-TEXT_ONLY_MODE = os.getenv("TEXT_ONLY_MODE", "false").lower() == "true"
-RUN_MODE = os.getenv("RUN_MODE", "normal").lower()
+DEBUG_MODE = _bool_env("DEBUG_MODE", True)
+DEBUG_MODE_INCLUDE_DELTA = _bool_env("DEBUG_MODE_INCLUDE_DELTA")
+TEXT_ONLY_MODE = _bool_env("TEXT_ONLY_MODE")
+RUN_MODE = _lower_env("RUN_MODE", "normal")
 
 # === Billy Hardware ===
-BILLY_MODEL = os.getenv("BILLY_MODEL", "modern").strip().lower()
+BILLY_MODEL = _lower_env("BILLY_MODEL", "modern")
 
 # === Audio Config ===
-SPEAKER_PREFERENCE = os.getenv("SPEAKER_PREFERENCE")
-MIC_PREFERENCE = os.getenv("MIC_PREFERENCE")
-MIC_TIMEOUT_SECONDS = int(os.getenv("MIC_TIMEOUT_SECONDS", "5"))
-SILENCE_THRESHOLD = int(os.getenv("SILENCE_THRESHOLD", "2000"))
-CHUNK_MS = int(os.getenv("CHUNK_MS", "50"))
+SPEAKER_PREFERENCE = _env("SPEAKER_PREFERENCE")
+MIC_PREFERENCE = _env("MIC_PREFERENCE")
+MIC_TIMEOUT_SECONDS = _int_env("MIC_TIMEOUT_SECONDS", 5)
+SILENCE_THRESHOLD = _int_env("SILENCE_THRESHOLD", 2000)
+CHUNK_MS = _int_env("CHUNK_MS", 50)
 PLAYBACK_VOLUME = 1
 
 # === GPIO Config ===
-BUTTON_PIN = int(os.getenv("BUTTON_PIN", "27"))
+BUTTON_PIN = _int_env("BUTTON_PIN", 27)
 
 # === MQTT Config (EXISTING - UNCHANGED) ===
-MQTT_HOST = os.getenv("MQTT_HOST", "")
-MQTT_PORT = int(os.getenv("MQTT_PORT", "0"))
-MQTT_USERNAME = os.getenv("MQTT_USERNAME", "")
-MQTT_PASSWORD = os.getenv("MQTT_PASSWORD", "")
+MQTT_HOST = _env("MQTT_HOST", "")
+MQTT_PORT = _int_env("MQTT_PORT", 0)
+MQTT_USERNAME = _env("MQTT_USERNAME", "")
+MQTT_PASSWORD = _env("MQTT_PASSWORD", "")
 
 # === Home Assistant Config (EXISTING - UNCHANGED) ===
-HA_HOST = os.getenv("HA_HOST")
-HA_TOKEN = os.getenv("HA_TOKEN")
-HA_LANG = os.getenv("HA_LANG", "en")
+HA_HOST = _env("HA_HOST")
+HA_TOKEN = _env("HA_TOKEN")
+HA_LANG = _env("HA_LANG", "en")
 
 # === Personality Config ===
-ALLOW_UPDATE_PERSONALITY_INI = (
-    os.getenv("ALLOW_UPDATE_PERSONALITY_INI", "true").lower() == "true"
-)
+ALLOW_UPDATE_PERSONALITY_INI = _bool_env("ALLOW_UPDATE_PERSONALITY_INI", True)
 
 # === Software Config ===
-FLASK_PORT = int(os.getenv("FLASK_PORT", "80"))
+FLASK_PORT = _int_env("FLASK_PORT", 80)
 
 
 def is_classic_billy():
-    return os.getenv("BILLY_MODEL", "modern").strip().lower() == "classic"
+    return BILLY_MODEL == "classic"
 
 
-try:
-    MAIN_LOOP = asyncio.get_event_loop()
-except RuntimeError:
-    MAIN_LOOP = None
+MAIN_LOOP = None
+
+
+def get_main_loop():
+    """Return the main event loop, acquiring it on first use."""
+    global MAIN_LOOP
+    if MAIN_LOOP is None:
+        try:
+            MAIN_LOOP = asyncio.get_running_loop()
+        except RuntimeError:
+            MAIN_LOOP = asyncio.new_event_loop()
+    return MAIN_LOOP
 
 
 # ============================================================================
 # NEW MULTI-PROVIDER SYSTEM (BACKWARD COMPATIBLE)
 # ============================================================================
 
-@dataclass
+# The config dataclasses are frozen and shared as-is between subsystems, so
+# nothing needs to copy them. Change the active config with set_billy_config(),
+# which rebuilds it via dataclasses.replace().
+
+
+@functools.lru_cache(maxsize=32)
+def _as_mapping(config) -> MappingProxyType:
+    values = {}
+    for f in fields(config):
+        value = getattr(config, f.name)
+        values[f.name] = _as_mapping(value) if is_dataclass(value) else value
+    return MappingProxyType(values)
+
+
+@dataclass(frozen=True, slots=True)
 class LLMConfig:
     provider: str
     model: str
-    api_key: Optional[str] = None
-    api_url: Optional[str] = None
+    api_key: str | None = None
+    api_url: str | None = None
     temperature: float = 0.7
     max_tokens: int = 150
 
-@dataclass 
+
+@dataclass(frozen=True, slots=True)
 class VoiceConfig:
     provider: str
     voice: str
-    api_key: Optional[str] = None
-    api_url: Optional[str] = None
+    model: str = "tts-1"
+    api_key: str | None = None
+    api_url: str | None = None
     speed: float = 1.0
+    response_format: str = "pcm"
+    gzip_requests: bool = False
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class MQTTConfig:
-    host: Optional[str] = None
+    host: str | None = None
     port: int = 1883
-    username: Optional[str] = None
-    password: Optional[str] = None
+    username: str | None = None
+    password: str | None = None
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class HomeAssistantConfig:
-    host: Optional[str] = None
-    token: Optional[str] = None
+    host: str | None = None
+    token: str | None = None
     language: str = "en"
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class BillyConfig:
     llm: LLMConfig
     voice: VoiceConfig
@@ -174,150 +296,227 @@ class BillyConfig:
     billy_model: str = "modern"
     flask_port: int = 80
     button_pin: int = 27
+    stream_batch_chars: int = 120  # Longest streamed text voiced as one TTS call
+
+    @property
+    def as_mapping(self) -> MappingProxyType:
+        """Read-only dict view of the config, built once per config instance"""
+        return _as_mapping(self)
 
 
+@functools.cache
 def detect_llm_provider() -> str:
     """Auto-detect LLM provider based on available configuration"""
     # Check for explicit provider override
-    if os.getenv("LLM_PROVIDER"):
-        return os.getenv("LLM_PROVIDER").lower()
-    
+    provider = _env("LLM_PROVIDER")
+    if provider:
+        return provider.lower()
+
     # Check for Ollama settings
-    if os.getenv("OLLAMA_HOST") or os.getenv("OLLAMA_URL") or os.getenv("LLM_API_URL"):
+    if _first_env("OLLAMA_HOST", "OLLAMA_URL", "LLM_API_URL"):
         return "ollama"
-    
-    # Check for Kobold settings  
-    if os.getenv("KOBOLD_URL") or os.getenv("KOBOLD_HOST"):
+
+    # Check for Kobold settings
+    if _first_env("KOBOLD_URL", "KOBOLD_HOST"):
         return "kobold"
-    
+
     # Default to OpenAI (backward compatibility)
     return "openai"
 
 
+@functools.cache
 def detect_voice_provider() -> str:
     """Auto-detect voice provider based on available configuration"""
     # Check for explicit provider override
-    if os.getenv("VOICE_PROVIDER"):
-        return os.getenv("VOICE_PROVIDER").lower()
-    
+    provider = _env("VOICE_PROVIDER")
+    if provider:
+        return provider.lower()
+
+    voice_api_url = _env("VOICE_API_URL", "").lower()
+
     # Check for ChatterAI settings
-    if os.getenv("CHATTERAI_API_KEY") or (os.getenv("VOICE_API_URL") and "chatter" in os.getenv("VOICE_API_URL", "").lower()):
+    if _env("CHATTERAI_API_KEY") or "chatter" in voice_api_url:
         return "chatterai"
-    
+
     # Check for XTT settings
-    if os.getenv("XTT_API_URL") or os.getenv("XTT_HOST") or (os.getenv("VOICE_API_URL") and "xtt" in os.getenv("VOICE_API_URL", "").lower()):
+    if _first_env("XTT_API_URL", "XTT_HOST") or "xtt" in voice_api_url:
         return "xtt"
-    
+
     # Default to OpenAI (backward compatibility)
     return "openai"
 
 
+def _ollama_api_url() -> str:
+    # Support multiple env var names for flexibility
+    api_url = _first_env("LLM_API_URL", "OLLAMA_URL")
+    if api_url:
+        return api_url
+    host = _env("OLLAMA_HOST")
+    if host:
+        if "://" not in host:
+            host = f"http://{host}"
+        return host
+    return "http://localhost:11434"  # Default
+
+
+# Per-provider settings. Values are callables so env overrides are resolved on
+# lookup; unknown providers fall back to the OpenAI entry.
+_LLM_SPEC = {
+    "openai": {
+        "model": lambda: OPENAI_MODEL,  # Use existing variable
+        "key": lambda: OPENAI_API_KEY,  # Use existing variable
+        "url": lambda: _env("OPENAI_API_URL"),  # None uses OpenAI's default
+    },
+    "ollama": {
+        "model": lambda: _first_env(
+            "LLM_MODEL", "OLLAMA_MODEL", default="llama3.2:latest"
+        ),
+        "key": lambda: _env("OLLAMA_API_KEY"),  # Usually None for local
+        "url": _ollama_api_url,
+    },
+    "kobold": {
+        "model": lambda: _env("LLM_MODEL", "kobold"),
+        "key": lambda: _env("KOBOLD_API_KEY"),
+        "url": lambda: _first_env(
+            "LLM_API_URL", "KOBOLD_URL", default="http://localhost:5000"
+        ),
+    },
+}
+
+_VOICE_SPEC = {
+    "openai": {
+        "voice": lambda: VOICE,
+        "model": lambda: _env("OPENAI_VOICE_MODEL", "tts-1"),
+        # Reuse the existing key when no voice-specific key is set
+        "key": lambda: _first_env("OPENAI_VOICE_API_KEY", default=OPENAI_API_KEY),
+        "url": lambda: _env("OPENAI_VOICE_API_URL"),  # None uses OpenAI's default
+    },
+    "chatterai": {
+        "voice": lambda: _env("VOICE", "natural"),
+        "model": lambda: _env("CHATTERAI_MODEL", "natural"),
+        "key": lambda: _env("CHATTERAI_API_KEY"),
+        "url": lambda: _first_env(
+            "VOICE_API_URL", "CHATTERAI_URL", default="https://api.chatterai.com"
+        ),
+    },
+    "xtt": {
+        "voice": lambda: _env("VOICE", "default"),
+        "model": lambda: _env("XTT_MODEL", "default"),
+        "key": lambda: _env("XTT_API_KEY"),
+        "url": lambda: _first_env(
+            "VOICE_API_URL", "XTT_API_URL", "XTT_HOST", default="http://localhost:8080"
+        ),
+    },
+}
+
+
+def _llm_setting(provider: str, field: str):
+    return _LLM_SPEC.get(provider, _LLM_SPEC["openai"])[field]()
+
+
+def _voice_setting(provider: str, field: str):
+    return _VOICE_SPEC.get(provider, _VOICE_SPEC["openai"])[field]()
+
+
+@functools.cache
 def get_llm_model(provider: str) -> str:
     """Get model name based on provider"""
-    if provider == "openai":
-        return OPENAI_MODEL  # Use existing variable
-    elif provider == "ollama":
-        return os.getenv("LLM_MODEL") or os.getenv("OLLAMA_MODEL", "llama3.2:latest")
-    elif provider == "kobold":
-        return os.getenv("LLM_MODEL", "kobold")
-    return OPENAI_MODEL  # Fallback to existing
+    return _llm_setting(provider, "model")
 
 
-def get_llm_api_key(provider: str) -> Optional[str]:
+@functools.cache
+def get_llm_api_key(provider: str) -> str | None:
     """Get API key based on provider"""
-    if provider == "openai":
-        return OPENAI_API_KEY  # Use existing variable
-    elif provider == "ollama":
-        return os.getenv("OLLAMA_API_KEY")  # Usually None for local
-    elif provider == "kobold":
-        return os.getenv("KOBOLD_API_KEY")
-    return OPENAI_API_KEY  # Fallback to existing
+    return _llm_setting(provider, "key")
 
 
-def get_llm_api_url(provider: str) -> Optional[str]:
+@functools.cache
+def get_llm_api_url(provider: str) -> str | None:
     """Get API URL based on provider"""
-    if provider == "openai":
-        return None  # Use OpenAI's default
-    elif provider == "ollama":
-        # Support multiple env var names for flexibility
-        if os.getenv("LLM_API_URL"):
-            return os.getenv("LLM_API_URL")
-        elif os.getenv("OLLAMA_URL"):
-            return os.getenv("OLLAMA_URL")
-        elif os.getenv("OLLAMA_HOST"):
-            host = os.getenv("OLLAMA_HOST")
-            if "://" not in host:
-                host = f"http://{host}"
-            return host
-        return "http://localhost:11434"  # Default
-    elif provider == "kobold":
-        return os.getenv("LLM_API_URL") or os.getenv("KOBOLD_URL", "http://localhost:5000")
-    return None
-
-
-def get_voice_api_key(provider: str) -> Optional[str]:
+    return _llm_setting(provider, "url")
+
+
+@functools.cache
+def get_voice_model(provider: str) -> str:
+    """Get voice model name based on provider"""
+    return _voice_setting(provider, "model")
+
+
+@functools.cache
+def get_voice(provider: str) -> str:
+    """Get voice name based on provider"""
+    return _voice_setting(provider, "voice")
+
+
+@functools.cache
+def get_voice_api_key(provider: str) -> str | None:
     """Get voice API key based on provider"""
-    if provider == "openai":
-        return OPENAI_API_KEY  # Reuse existing key
-    elif provider == "chatterai":
-        return os.getenv("CHATTERAI_API_KEY")
-    elif provider == "xtt":
-        return os.getenv("XTT_API_KEY")
-    return OPENAI_API_KEY  # Fallback to existing
+    return _voice_setting(provider, "key")
 
 
-def get_voice_api_url(provider: str) -> Optional[str]:
+@functools.cache
+def get_voice_api_url(provider: str) -> str | None:
     """Get voice API URL based on provider"""
-    if provider == "openai":
-        return None  # Use OpenAI's default
-    elif provider == "chatterai":
-        return os.getenv("VOICE_API_URL") or os.getenv("CHATTERAI_URL", "https://api.chatterai.com")
-    elif provider == "xtt":
-        return os.getenv("VOICE_API_URL") or os.getenv("XTT_API_URL") or os.getenv("XTT_HOST", "http://localhost:8080")
-    return None
+    return _voice_setting(provider, "url")
+
+
+def _build_llm_config(provider: str, temperature: float, max_tokens: int) -> LLMConfig:
+    return LLMConfig(
+        provider=provider,
+        model=get_llm_model(provider),
+        api_key=get_llm_api_key(provider),
+        api_url=get_llm_api_url(provider),
+        temperature=temperature,
+        max_tokens=max_tokens,
+    )
+
+
+def _build_voice_config(provider: str, speed: float) -> VoiceConfig:
+    return VoiceConfig(
+        provider=provider,
+        voice=get_voice(provider),
+        model=get_voice_model(provider),
+        api_key=get_voice_api_key(provider),
+        api_url=get_voice_api_url(provider),
+        speed=speed,
+        response_format=TTS_RESPONSE_FORMAT,
+        gzip_requests=TTS_GZIP_REQUESTS,
+    )
+
+
+# Config builders per provider; unknown providers fall back to OpenAI
+_LLM_BUILDERS = {name: functools.partial(_build_llm_config, name) for name in _LLM_SPEC}
+_VOICE_BUILDERS = {
+    name: functools.partial(_build_voice_config, name) for name in _VOICE_SPEC
+}
 
 
 def load_billy_config() -> BillyConfig:
     """Load complete Billy configuration with backward compatibility"""
-    
-    # Detect providers
-    llm_provider = detect_llm_provider()
-    voice_provider = detect_voice_provider()
-    
+
     # LLM Configuration
-    llm_config = LLMConfig(
-        provider=llm_provider,
-        model=get_llm_model(llm_provider),
-        api_key=get_llm_api_key(llm_provider),
-        api_url=get_llm_api_url(llm_provider),
-        temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-        max_tokens=int(os.getenv("LLM_MAX_TOKENS", "150"))
-    )
-    
-    # Voice Configuration  
-    voice_config = VoiceConfig(
-        provider=voice_provider,
-        voice=VOICE,  # Use existing VOICE variable
-        api_key=get_voice_api_key(voice_provider),
-        api_url=get_voice_api_url(voice_provider),
-        speed=float(os.getenv("VOICE_SPEED", "1.0"))
+    llm_builder = _LLM_BUILDERS.get(detect_llm_provider(), _LLM_BUILDERS["openai"])
+    llm_config = llm_builder(LLM_TEMPERATURE, LLM_MAX_TOKENS)
+
+    # Voice Configuration
+    voice_builder = _VOICE_BUILDERS.get(
+        detect_voice_provider(), _VOICE_BUILDERS["openai"]
     )
-    
+    voice_config = voice_builder(VOICE_SPEED)
+
     # MQTT Configuration (use existing variables)
     mqtt_config = MQTTConfig(
         host=MQTT_HOST if MQTT_HOST else None,
         port=MQTT_PORT if MQTT_PORT > 0 else 1883,
         username=MQTT_USERNAME if MQTT_USERNAME else None,
-        password=MQTT_PASSWORD if MQTT_PASSWORD else None
+        password=MQTT_PASSWORD if MQTT_PASSWORD else None,
     )
-    
-    # Home Assistant Configuration (use existing variables)  
+
+    # Home Assistant Configuration (use existing variables)
     ha_config = HomeAssistantConfig(
-        host=HA_HOST,
-        token=HA_TOKEN,
-        language=HA_LANG.lower()
+        host=HA_HOST, token=HA_TOKEN, language=HA_LANG.lower()
     )
-    
+
     return BillyConfig(
         llm=llm_config,
         voice=voice_config,
@@ -331,7 +530,8 @@ def load_billy_config() -> BillyConfig:
         allow_personality_updates=ALLOW_UPDATE_PERSONALITY_INI,
         billy_model=BILLY_MODEL,
         flask_port=FLASK_PORT,
-        button_pin=BUTTON_PIN
+        button_pin=BUTTON_PIN,
+        stream_batch_chars=STREAM_BATCH_CHARS,
     )
 
 
@@ -340,42 +540,46 @@ def load_billy_config() -> BillyConfig:
 # ============================================================================
 
 # === Ollama Provider Config ===
-OLLAMA_HOST = os.getenv("OLLAMA_HOST", "localhost:11434")
-OLLAMA_URL = os.getenv("OLLAMA_URL", f"http://{OLLAMA_HOST}")
-OLLAMA_MODEL = os.getenv("OLLAMA_MODEL", "llama3.2:latest")
-OLLAMA_API_KEY = os.getenv("OLLAMA_API_KEY")  # Usually None
+OLLAMA_HOST = _env("OLLAMA_HOST", "localhost:11434")
+OLLAMA_URL = _env("OLLAMA_URL", f"http://{OLLAMA_HOST}")
+OLLAMA_MODEL = _env("OLLAMA_MODEL", "llama3.2:latest")
+OLLAMA_API_KEY = _env("OLLAMA_API_KEY")  # Usually None
 
 # === Kobold AI Provider Config ===
-KOBOLD_URL = os.getenv("KOBOLD_URL", "http://localhost:5000")
-KOBOLD_HOST = os.getenv("KOBOLD_HOST", "localhost:5000")
-KOBOLD_API_KEY = os.getenv("KOBOLD_API_KEY")
-KOBOLD_MAX_CONTEXT = int(os.getenv("KOBOLD_MAX_CONTEXT", "2048"))
+KOBOLD_URL = _env("KOBOLD_URL", "http://localhost:5000")
+KOBOLD_HOST = _env("KOBOLD_HOST", "localhost:5000")
+KOBOLD_API_KEY = _env("KOBOLD_API_KEY")
+KOBOLD_MAX_CONTEXT = _int_env("KOBOLD_MAX_CONTEXT", 2048)
 
 # === ChatterAI Provider Config ===
-CHATTERAI_API_KEY = os.getenv("CHATTERAI_API_KEY")
-CHATTERAI_URL = os.getenv("CHATTERAI_URL", "https://api.chatterai.com")
+CHATTERAI_API_KEY = _env("CHATTERAI_API_KEY")
+CHATTERAI_URL = _env("CHATTERAI_URL", "https://api.chatterai.com")
 
 # === XTT Provider Config ===
-XTT_API_KEY = os.getenv("XTT_API_KEY")
-XTT_API_URL = os.getenv("XTT_API_URL", "http://localhost:8080")
-XTT_HOST = os.getenv("XTT_HOST", "localhost:8080")
+XTT_API_KEY = _env("XTT_API_KEY")
+XTT_API_URL = _env("XTT_API_URL", "http://localhost:8080")
+XTT_HOST = _env("XTT_HOST", "localhost:8080")
 
 # === Generic Provider Overrides ===
-LLM_PROVIDER = os.getenv("LLM_PROVIDER", detect_llm_provider())
-LLM_MODEL = os.getenv("LLM_MODEL")
-LLM_API_URL = os.getenv("LLM_API_URL")
-LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.7"))
-LLM_MAX_TOKENS = int(os.getenv("LLM_MAX_TOKENS", "150"))
+LLM_PROVIDER = _env("LLM_PROVIDER") or detect_llm_provider()
+LLM_MODEL = _env("LLM_MODEL")
+LLM_API_URL = _env("LLM_API_URL")
+LLM_TEMPERATURE = _float_env("LLM_TEMPERATURE", 0.7)
+LLM_MAX_TOKENS = _int_env("LLM_MAX_TOKENS", 150)
 
-VOICE_PROVIDER = os.getenv("VOICE_PROVIDER", detect_voice_provider())
-VOICE_API_URL = os.getenv("VOICE_API_URL")
-VOICE_SPEED = float(os.getenv("VOICE_SPEED", "1.0"))
+VOICE_PROVIDER = _env("VOICE_PROVIDER") or detect_voice_provider()
+VOICE_API_URL = _env("VOICE_API_URL")
+VOICE_SPEED = _float_env("VOICE_SPEED", 1.0)
+TTS_RESPONSE_FORMAT = _env("TTS_RESPONSE_FORMAT", "pcm")
+TTS_GZIP_REQUESTS = _bool_env("TTS_GZIP_REQUESTS")
+STREAM_BATCH_CHARS = _int_env("STREAM_BATCH_CHARS", 120)
 
 
 # ============================================================================
 # CONVENIENCE FUNCTIONS FOR EXISTING CODE
 # ============================================================================
 
+
 def get_current_llm_provider() -> str:
     """Get currently configured LLM provider"""
     return detect_llm_provider()
@@ -406,7 +610,27 @@ def get_effective_api_key() -> str:
 # BACKWARD COMPATIBILITY GLOBALS
 # ============================================================================
 
-# These ensure existing code continues to work without changes
-BILLY_CONFIG = load_billy_config()  # Structured config for new code
-CURRENT_LLM_PROVIDER = get_current_llm_provider()  # For existing code
-CURRENT_VOICE_PROVIDER = get_current_voice_provider()  # For existing code
+# These ensure existing code continues to work without changes. They are built on
+# first access (PEP 562) so importing this module doesn't pay for them.
+_LAZY_GLOBALS = {
+    "INSTRUCTIONS": _instructions,
+    "BILLY_CONFIG": load_billy_config,  # Structured config for new code
+    "CURRENT_LLM_PROVIDER": get_current_llm_provider,  # For existing code
+    "CURRENT_VOICE_PROVIDER": get_current_voice_provider,  # For existing code
+}
+_lazy = {}
+
+
+def set_billy_config(**changes) -> BillyConfig:
+    """Replace fields of the active BILLY_CONFIG and return the new config"""
+    config = replace(__getattr__("BILLY_CONFIG"), **changes)
+    _lazy["BILLY_CONFIG"] = config
+    return config
+
+
+def __getattr__(name):
+    if name not in _LAZY_GLOBALS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if name not in _lazy:
+        _lazy[name] = _LAZY_GLOBALS[name]()
+    return _lazy[name]
@@ -0,0 +1,14 @@
+import asyncio
+import sys
+
+
+def run_event_loop(coro):
+    """Run the coroutine on uvloop where available, else the default loop"""
+    try:
+        import uvloop
+    except ImportError:  # e.g. on Windows
+        return asyncio.run(coro)
+    if sys.version_info >= (3, 12):
+        return asyncio.run(coro, loop_factory=uvloop.new_event_loop)
+    uvloop.install()
+    return asyncio.run(coro)
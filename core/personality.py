@@ -1,7 +1,8 @@
 # core/personality.py
-import configparser
+import functools
 import os
 import shutil
+from collections.abc import Mapping
 
 
 class PersonalityProfile:
@@ -101,8 +102,58 @@ class PersonalityProfile:
         return "\n".join(lines)
 
 
-# helper to load from persona.ini
-def load_traits_from_ini(path="persona.ini") -> dict:
+def _fast_ini(path: str) -> dict | None:
+    """Scan a simple INI file into {section: {key: value}}.
+
+    Only plain ``key = value`` lines are understood. Returns None when the file uses
+    anything configparser would treat differently (continuation lines, interpolation,
+    [DEFAULT], duplicates, ...), so the caller can fall back to configparser.
+    """
+    sections = {}
+    section = None
+    with open(path) as f:
+        for raw in f:
+            line = raw.strip()
+            if not line or line[0] in ";#":
+                continue
+            if raw[0].isspace() or "%" in line:
+                return None
+            if line[0] == "[" and line[-1] == "]":
+                name = line[1:-1]
+                if name in sections or name == "DEFAULT":
+                    return None
+                section = sections[name] = {}
+                continue
+            # configparser splits on whichever of "=" or ":" comes first
+            sep = min(
+                (i for i in (line.find("="), line.find(":")) if i != -1), default=-1
+            )
+            if section is None or sep == -1:
+                return None
+            key = line[:sep].strip().lower()
+            if key in section:
+                return None
+            section[key] = line[sep + 1 :].strip()
+    return sections
+
+
+@functools.lru_cache(maxsize=8)
+def _parse_ini(path: str, mtime: float):
+    # mtime is part of the cache key so edits to the file invalidate the entry
+    sections = _fast_ini(path)
+    if sections is not None:
+        return sections
+
+    import configparser
+
+    config = configparser.ConfigParser()
+    config.read(path)
+    return config
+
+
+def load_persona_ini(path="persona.ini") -> Mapping[str, Mapping[str, str]]:
+    """Parse persona.ini once per file version, creating it from the example
+    if it doesn't exist yet."""
     if not os.path.exists(path):
         # Copy default
         example_path = path + ".example"
@@ -111,8 +162,15 @@ def load_traits_from_ini(path="persona.ini") -> dict:
         shutil.copy(example_path, path)
         print("✅ persona.ini file created from persona.ini.example")
 
-    config = configparser.ConfigParser()
-    config.read(path)
+    return _parse_ini(path, os.path.getmtime(path))
+
+
+# helper to load from persona.ini
+def load_traits_from_ini(
+    path="persona.ini", config: Mapping[str, Mapping[str, str]] | None = None
+) -> dict:
+    if config is None:
+        config = load_persona_ini(path)
 
     if "PERSONALITY" not in config:
         raise RuntimeError(f"❌ [PERSONALITY] section missing in {path}")
@@ -8,589 +8,696 @@ Supports multiple voice providers: OpenAI TTS, ChatterAI, XTT
 """
 
 import asyncio
-import configparser
+import functools
+import hashlib
+import logging
 import os
+import re
 import sys
-import signal
-import json
-from dataclasses import dataclass
-from typing import Optional
+from collections import OrderedDict
 
-from dotenv import load_dotenv
 
 # Add project root to path for imports
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-try:
-    from personality import (
-        PersonalityProfile,
-        load_traits_from_ini,
-    )
-except ImportError:
-    print("Warning: personality module not found - using minimal personality system")
-    class PersonalityProfile:
-        def __init__(self, **kwargs):
-            pass
-        def generate_prompt(self):
-            return "You are Billy, a talking fish with attitude."
-    
-    def load_traits_from_ini(path):
-        return {}
-
-# Import our new provider system
-try:
-    from providers.factory import ProviderFactory
-    from providers.base import ModelType
-    PROVIDERS_AVAILABLE = True
-    print("✅ Multi-provider system loaded successfully")
-except ImportError as e:
-    print(f"❌ Provider system not available: {e}")
-    print("📝 Make sure you've created the providers/ directory structure")
-    PROVIDERS_AVAILABLE = False
+# Configuration, persona and instructions all come from core.config; the legacy
+# names are re-exported for backward compatibility
+from core import config as core_config
+from core.config import (  # noqa: F401
+    BILLY_MODEL,
+    DEBUG_MODE,
+    OPENAI_API_KEY,
+    VOICE,
+    BillyConfig,
+    is_classic_billy,
+)
+from core.loop import run_event_loop
+
+
+logger = logging.getLogger(__name__)
+
+
+# Our new provider system pulls in aiohttp and the provider SDKs, so it is only
+# imported once something actually needs a provider
+@functools.cache
+def _load_providers():
+    """Import the provider system, or return None if it isn't available"""
+    try:
+        from providers import audio_utils
+        from providers.base import ModelType
+        from providers.factory import ProviderFactory
+        from providers.http_session import close_http_session
+    except ImportError as e:
+        logger.error("❌ Provider system not available: %s", e)
+        logger.error("📝 Make sure you've created the providers/ directory structure")
+        return None
+    logger.info("✅ Multi-provider system loaded successfully")
+    return {
+        "ProviderFactory": ProviderFactory,
+        "ModelType": ModelType,
+        "audio_utils": audio_utils,
+        "close_http_session": close_http_session,
+    }
+
+
+def providers_available() -> bool:
+    """Check whether the provider system can be imported"""
+    return _load_providers() is not None
+
 
 # ============================================================================
 # CONFIGURATION SYSTEM
 # ============================================================================
 
-# === Paths ===
-ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
-ENV_PATH = os.path.join(ROOT_DIR, ".env")
-PERSONA_PATH = os.path.join(ROOT_DIR, "persona.ini")
-
-# === Load .env ===
-load_dotenv(dotenv_path=ENV_PATH)
-
-# === Load personality ===
-try:
-    traits = load_traits_from_ini(PERSONA_PATH)
-    PERSONALITY = PersonalityProfile(**traits)
-    
-    _config = configparser.ConfigParser()
-    _config.read(PERSONA_PATH)
-    
-    EXTRA_INSTRUCTIONS = _config.get("META", "instructions") if _config.has_section("META") else ""
-    if _config.has_section("BACKSTORY"):
-        BACKSTORY = dict(_config.items("BACKSTORY"))
-        BACKSTORY_FACTS = "\n".join([f"- {key}: {value}" for key, value in BACKSTORY.items()])
-    else:
-        BACKSTORY = {}
-        BACKSTORY_FACTS = "You are Billy Bass, a talking fish with no configured backstory."
-        
-except Exception as e:
-    print(f"Warning: Could not load personality configuration: {e}")
-    PERSONALITY = PersonalityProfile()
-    EXTRA_INSTRUCTIONS = ""
-    BACKSTORY_FACTS = "You are Billy Bass, a talking fish with attitude."
-
-# === Instructions for AI ===
-BASE_INSTRUCTIONS = """
-You also have special powers:
-- If someone asks if you like fishsticks you answer Yes. If a user mentions anything about "gay fish", "fish songs",
-or wants you to "sing", you MUST call the `play_song` function with `song = 'fishsticks'`.
-- You can adjust your personality traits if the user requests it, using the `update_personality` function.
-- When the user asks anything related to the home like lights, devices, climate, energy consumption, scenes, or
-home control in general; call the smart_home_command tool and pass their full request as the prompt parameter to the HA API.
-You will get a response back from Home Assistant itself so you have to interpret and explain it to the end user.
-
-You are allowed to call tools mid-conversation to trigger special behaviors.
-
-DO NOT explain or confirm that you are triggering a tool. Just smoothly integrate it.
-"""
+# CONFIG and INSTRUCTIONS are forwarded from core.config on first access
+# (PEP 562), so importing this module doesn't build them.
+_CORE_GLOBALS = {
+    "CONFIG": "BILLY_CONFIG",
+    "INSTRUCTIONS": "INSTRUCTIONS",
+}
 
-INSTRUCTIONS = (
-    BASE_INSTRUCTIONS.strip()
-    + "\n\n"
-    + EXTRA_INSTRUCTIONS.strip()
-    + "\n\n"
-    + "Known facts about your past:\n"
-    + BACKSTORY_FACTS
-    + "\n\n"
-    + PERSONALITY.generate_prompt()
-)
 
-# ============================================================================
-# PROVIDER CONFIGURATION
-# ============================================================================
+def get_config() -> BillyConfig:
+    """Return the Billy configuration, loading it on first use"""
+    return core_config.BILLY_CONFIG
+
+
+def __getattr__(name):
+    if name in _CORE_GLOBALS:
+        return getattr(core_config, _CORE_GLOBALS[name])
+    if name == "PROVIDERS_AVAILABLE":
+        return providers_available()
+    if name in ("ProviderFactory", "ModelType") and providers_available():
+        return _load_providers()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-@dataclass
-class LLMConfig:
-    provider: str
-    model: str
-    api_key: Optional[str] = None
-    api_url: Optional[str] = None
-    temperature: float = 0.7
-    max_tokens: int = 150
-
-@dataclass 
-class VoiceConfig:
-    provider: str
-    voice: str
-    model: str
-    api_key: Optional[str] = None
-    api_url: Optional[str] = None
-    speed: float = 1.0
-
-@dataclass
-class BillyConfig:
-    llm: LLMConfig
-    voice: VoiceConfig
-    # Hardware settings
-    billy_model: str = "modern"
-    button_pin: int = 27
-    mic_timeout: int = 5
-    silence_threshold: int = 2000
-    # Debug settings
-    debug_mode: bool = False
-    debug_include_delta: bool = False
-    # Integration settings
-    mqtt_host: Optional[str] = None
-    mqtt_port: int = 1883
-    mqtt_username: Optional[str] = None
-    mqtt_password: Optional[str] = None
-    ha_host: Optional[str] = None
-    ha_token: Optional[str] = None
-    ha_lang: str = "en"
-
-def detect_llm_provider() -> str:
-    """Auto-detect LLM provider based on configuration"""
-    if os.getenv("LLM_PROVIDER"):
-        return os.getenv("LLM_PROVIDER").lower()
-    if os.getenv("OLLAMA_HOST") or os.getenv("OLLAMA_URL"):
-        return "ollama"
-    if os.getenv("KOBOLD_URL"):
-        return "kobold"
-    return "openai"
-
-def detect_voice_provider() -> str:
-    """Auto-detect voice provider based on configuration"""
-    if os.getenv("VOICE_PROVIDER"):
-        return os.getenv("VOICE_PROVIDER").lower()
-    if os.getenv("CHATTERAI_API_KEY"):
-        return "chatterai"
-    if os.getenv("XTT_API_URL"):
-        return "xtt"
-    return "openai"
-
-def load_config() -> BillyConfig:
-    """Load Billy configuration"""
-    # Detect providers
-    llm_provider = detect_llm_provider()
-    voice_provider = detect_voice_provider()
-    
-    # LLM Configuration
-    if llm_provider == "openai":
-        llm_config = LLMConfig(
-            provider="openai",
-            model=os.getenv("OPENAI_MODEL", "gpt-4o-mini-realtime-preview"),
-            api_key=os.getenv("OPENAI_API_KEY"),
-            api_url=os.getenv("OPENAI_API_URL"),
-            temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "150"))
-        )
-    elif llm_provider == "ollama":
-        api_url = os.getenv("LLM_API_URL") or os.getenv("OLLAMA_URL")
-        if not api_url and os.getenv("OLLAMA_HOST"):
-            host = os.getenv("OLLAMA_HOST")
-            api_url = f"http://{host}" if "://" not in host else host
-        llm_config = LLMConfig(
-            provider="ollama",
-            model=os.getenv("LLM_MODEL", os.getenv("OLLAMA_MODEL", "llama3.2:latest")),
-            api_url=api_url or "http://localhost:11434",
-            temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "150"))
-        )
-    elif llm_provider == "kobold":
-        llm_config = LLMConfig(
-            provider="kobold",
-            model="kobold",
-            api_url=os.getenv("LLM_API_URL", os.getenv("KOBOLD_URL", "http://localhost:5000")),
-            api_key=os.getenv("KOBOLD_API_KEY"),
-            temperature=float(os.getenv("LLM_TEMPERATURE", "0.7")),
-            max_tokens=int(os.getenv("LLM_MAX_TOKENS", "150"))
-        )
-    else:
-        llm_config = LLMConfig(provider="openai", model="gpt-4o-mini-realtime-preview")
-    
-    # Voice Configuration  
-    if voice_provider == "openai":
-        voice_config = VoiceConfig(
-            provider="openai",
-            voice=os.getenv("VOICE", "ash"),
-            model=os.getenv("OPENAI_VOICE_MODEL", "tts-1"),
-            api_key=os.getenv("OPENAI_VOICE_API_KEY", os.getenv("OPENAI_API_KEY")),
-            api_url=os.getenv("OPENAI_VOICE_API_URL"),
-            speed=float(os.getenv("VOICE_SPEED", "1.0"))
-        )
-    elif voice_provider == "chatterai":
-        voice_config = VoiceConfig(
-            provider="chatterai",
-            voice=os.getenv("VOICE", "natural"),
-            model=os.getenv("CHATTERAI_MODEL", "natural"),
-            api_key=os.getenv("CHATTERAI_API_KEY"),
-            api_url=os.getenv("VOICE_API_URL", os.getenv("CHATTERAI_URL", "https://api.chatterai.com")),
-            speed=float(os.getenv("VOICE_SPEED", "1.0"))
-        )
-    elif voice_provider == "xtt":
-        voice_config = VoiceConfig(
-            provider="xtt",
-            voice=os.getenv("VOICE", "default"),
-            model=os.getenv("XTT_MODEL", "default"),
-            api_key=os.getenv("XTT_API_KEY"),
-            api_url=os.getenv("VOICE_API_URL", os.getenv("XTT_API_URL", "http://localhost:8080")),
-            speed=float(os.getenv("VOICE_SPEED", "1.0"))
-        )
-    else:
-        voice_config = VoiceConfig(provider="openai", voice="ash", model="tts-1")
-    
-    return BillyConfig(
-        llm=llm_config,
-        voice=voice_config,
-        billy_model=os.getenv("BILLY_MODEL", "modern").lower(),
-        button_pin=int(os.getenv("BUTTON_PIN", "27")),
-        mic_timeout=int(os.getenv("MIC_TIMEOUT_SECONDS", "5")),
-        silence_threshold=int(os.getenv("SILENCE_THRESHOLD", "2000")),
-        debug_mode=os.getenv("DEBUG_MODE", "true").lower() == "true",
-        debug_include_delta=os.getenv("DEBUG_MODE_INCLUDE_DELTA", "false").lower() == "true",
-        mqtt_host=os.getenv("MQTT_HOST") or None,
-        mqtt_port=int(os.getenv("MQTT_PORT", "1883")),
-        mqtt_username=os.getenv("MQTT_USERNAME") or None,
-        mqtt_password=os.getenv("MQTT_PASSWORD") or None,
-        ha_host=os.getenv("HA_HOST"),
-        ha_token=os.getenv("HA_TOKEN"),
-        ha_lang=os.getenv("HA_LANG", "en").lower()
-    )
-
-# Load configuration
-CONFIG = load_config()
-
-# Legacy variables for backward compatibility
-OPENAI_API_KEY = CONFIG.llm.api_key if CONFIG.llm.provider == "openai" else os.getenv("OPENAI_API_KEY", "")
-VOICE = CONFIG.voice.voice
-DEBUG_MODE = CONFIG.debug_mode
-BILLY_MODEL = CONFIG.billy_model
-
-def is_classic_billy():
-    return CONFIG.billy_model == "classic"
 
 # ============================================================================
 # BILLY BASS ASSISTANT CLASS
 # ============================================================================
 
+# Whitespace that follows sentence-ending punctuation, or a line break
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+_FLUSH_CHARS = re.compile(r"[.!?\n]")
+
+
 class BillyBassAssistant:
     """Main Billy Bass Assistant with multi-provider support"""
-    
+
     def __init__(self):
-        self.config = CONFIG
+        self.config = get_config()
         self.llm_provider = None
         self.voice_provider = None
         self.session_active = False
         self.shutdown_requested = False
-        
+
+        # Speech pipeline: sentences -> TTS worker -> sequencer -> audio ->
+        # playback worker. The TTS worker synthesizes up to four sentences at
+        # once and the sequencer forwards their audio in order. The bounded
+        # queues let LLM, TTS and playback overlap, and a None sentinel stops
+        # each worker in turn.
+        self._text_q = asyncio.Queue(maxsize=8)
+        self._render_q = asyncio.Queue(maxsize=4)
+        self._audio_q = asyncio.Queue(maxsize=4)
+        self._tts_limit = asyncio.Semaphore(4)
+        self._workers = []
+
+        # Streamed reply text is written to stdout in batches, not per token
+        self._out_buf: list[str] = []
+        self._out_len = 0
+        self._flush_threshold = 64
+
+        # Exact-match LRU of (conversation so far, normalized prompt) ->
+        # (reply text, spoken clips), so repeated questions skip both the
+        # LLM and TTS. The digest covers this session's earlier exchanges,
+        # so a reply is only reused at the same point in a conversation
+        self._response_cache: OrderedDict[str, tuple[str, tuple]] = OrderedDict()
+        self._response_cache_size = 128
+        self._turn_clips: list[tuple[bytes, str]] = []
+        self._turn_sentences = 0
+        self._history_digest = b""
+
+        # LRU of (provider, model, voice, speed, sentence) -> PCM, so repeated
+        # phrases ("Hello!", error prompts) skip the TTS round-trip. Capped by
+        # size; the reply cache's clips share these same bytes objects
+        self._tts_cache: OrderedDict[tuple, bytes] = OrderedDict()
+        self._tts_cache_bytes = 0
+        self._tts_cache_max_bytes = 16 * 1024 * 1024  # About 6 minutes of speech
+
         # Hardware components (to be implemented based on existing Billy setup)
         self.motor_controller = None
         self.audio_player = None
         self.button_handler = None
-        
-        print(f"🐟 Billy Bass Assistant initializing...")
-        print(f"📡 LLM Provider: {self.config.llm.provider}")
-        print(f"🔊 Voice Provider: {self.config.voice.provider}")
-    
+
+        logger.info("🐟 Billy Bass Assistant initializing...")
+        logger.info("📡 LLM Provider: %s", self.config.llm.provider)
+        logger.info("🔊 Voice Provider: %s", self.config.voice.provider)
+
     async def initialize(self):
         """Initialize Billy Bass with configured providers"""
-        if not PROVIDERS_AVAILABLE:
-            print("❌ Provider system not available - check providers/ directory")
+        if not providers_available():
+            logger.error(
+                "❌ Provider system not available - check providers/ directory"
+            )
             return False
-        
+        ProviderFactory = _load_providers()["ProviderFactory"]
+
+        # Bring the hardware up in the background while providers load
+        hardware = asyncio.create_task(self.initialize_hardware())
         try:
+            await ProviderFactory.preload(
+                self.config.llm.provider, self.config.voice.provider
+            )
+
             # Initialize LLM Provider
-            print(f"🔧 Initializing {self.config.llm.provider} LLM provider...")
+            logger.info("🔧 Initializing %s LLM provider...", self.config.llm.provider)
             llm_config = {
                 'provider': self.config.llm.provider,
                 'model': self.config.llm.model,
                 'api_key': self.config.llm.api_key,
                 'api_url': self.config.llm.api_url,
                 'temperature': self.config.llm.temperature,
-                'max_tokens': self.config.llm.max_tokens
+                'max_tokens': self.config.llm.max_tokens,
+                'max_context': core_config.KOBOLD_MAX_CONTEXT,
+                'system_prompt': core_config.INSTRUCTIONS,
             }
             self.llm_provider = await ProviderFactory.create_llm_provider(llm_config)
-            
+
             # Initialize Voice Provider
-            print(f"🔧 Initializing {self.config.voice.provider} voice provider...")
+            logger.info(
+                "🔧 Initializing %s voice provider...", self.config.voice.provider
+            )
             voice_config = {
                 'provider': self.config.voice.provider,
                 'voice': self.config.voice.voice,
                 'model': self.config.voice.model,
                 'api_key': self.config.voice.api_key,
                 'api_url': self.config.voice.api_url,
-                'speed': self.config.voice.speed
+                'speed': self.config.voice.speed,
+                'response_format': self.config.voice.response_format,
+                'gzip_requests': self.config.voice.gzip_requests,
             }
-            self.voice_provider = await ProviderFactory.create_voice_provider(voice_config)
-            
-            # Initialize hardware components
-            await self.initialize_hardware()
-            
-            print(f"✅ Billy Bass initialized successfully!")
-            print(f"🎯 Model: {self.config.llm.model}")
-            print(f"🔊 Voice: {self.config.voice.voice}")
+            self.voice_provider = await ProviderFactory.create_voice_provider(
+                voice_config
+            )
+
+            # Prime the LLM and TTS servers so the first real turn isn't cold
+            await asyncio.gather(hardware, self._warmup_llm(), self._warmup_tts())
+
+            logger.info("✅ Billy Bass initialized successfully!")
+            logger.info("🎯 Model: %s", self.config.llm.model)
+            logger.info("🔊 Voice: %s", self.config.voice.voice)
             return True
-            
+
         except Exception as e:
-            print(f"❌ Failed to initialize Billy Bass: {e}")
+            logger.error("❌ Failed to initialize Billy Bass: %s", e)
+            hardware.cancel()
+            await asyncio.gather(hardware, return_exceptions=True)
             return False
-    
+
+    async def _warmup_llm(self):
+        """Send a one-token request so the server loads the model and warms its cache"""
+        ModelType = _load_providers()["ModelType"]
+        if self.llm_provider.get_model_type() == ModelType.REALTIME:
+            return
+
+        max_tokens = getattr(self.llm_provider, "max_tokens", None)
+        try:
+            if max_tokens is not None:
+                self.llm_provider.max_tokens = 1
+            # Start a session first so the prompt carries the system prompt,
+            # which is the prefix the server should cache
+            await self.llm_provider.start_session()
+            await self.llm_provider.send_message("hi")
+            async for _ in self.llm_provider.get_response_stream():
+                pass
+            logger.debug("🔥 LLM warmed up")
+        except Exception as e:
+            logger.warning("⚠️  LLM warmup failed: %s", e)
+        finally:
+            if max_tokens is not None:
+                self.llm_provider.max_tokens = max_tokens
+            # Drop the warmup turn from the history
+            try:
+                await self.llm_provider.start_session()
+            except Exception as e:
+                logger.warning("⚠️  LLM session reset failed: %s", e)
+
+    async def _warmup_tts(self):
+        """Synthesize a single space so the voice server loads its model"""
+        # Compile the mouth envelope now rather than on the first reply
+        await asyncio.to_thread(_load_providers()["audio_utils"].warmup)
+        try:
+            await self.voice_provider.text_to_speech(
+                " ",
+                {'voice': self.config.voice.voice, 'speed': self.config.voice.speed},
+            )
+            logger.debug("🔥 Voice warmed up")
+        except Exception as e:
+            logger.warning("⚠️  Voice warmup failed: %s", e)
+
     async def initialize_hardware(self):
         """Initialize Billy Bass hardware components"""
-        print("🔧 Initializing hardware components...")
-        
+        logger.info("🔧 Initializing hardware components...")
+
         # TODO: Initialize based on existing Billy Bass hardware code:
         # - GPIO setup for motors
         # - Audio system setup
         # - Button interrupt setup
         # - Motor controller setup
-        
-        print("🎛️  Hardware initialization complete")
-    
+
+        logger.info("🎛️  Hardware initialization complete")
+
     async def start_conversation(self):
         """Start a new conversation session"""
         if not self.llm_provider:
-            print("❌ No LLM provider available")
+            logger.error("❌ No LLM provider available")
             return False
-        
+
         try:
             await self.llm_provider.start_session()
+            self._history_digest = b""
+            if not self._workers:
+                self._workers = [
+                    asyncio.create_task(self._tts_worker()),
+                    asyncio.create_task(self._sequence_worker()),
+                    asyncio.create_task(self._playback_worker()),
+                ]
             self.session_active = True
-            print("🗣️  Conversation session started")
+            logger.info("🗣️  Conversation session started")
             return True
         except Exception as e:
-            print(f"❌ Failed to start conversation: {e}")
+            logger.error("❌ Failed to start conversation: %s", e)
             return False
-    
+
     async def process_user_input(self, user_message: str):
         """Process user input and generate response"""
-        if not self.session_active:
-            if not await self.start_conversation():
-                return
-        
+        if not self.session_active and not await self.start_conversation():
+            return
+
         try:
-            print(f"👤 User: {user_message}")
-            
+            logger.debug("👤 User: %s", user_message)
+
+            key = self._response_key(user_message)
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                self._response_cache.move_to_end(key)
+                text, clips = cached
+                print(f"🤖 Billy (cached): {text}")
+                for clip in clips:
+                    await self._audio_q.put(clip)
+                # The model never saw this turn, so add it to its history
+                await self.llm_provider.add_exchange(user_message, text)
+                self._advance_history(user_message, text)
+                return
+            self._turn_clips = []
+            self._turn_sentences = 0
+
             # Send message to LLM provider
             await self.llm_provider.send_message(user_message)
-            
+
             # Handle response based on provider type
+            ModelType = _load_providers()["ModelType"]
             model_type = self.llm_provider.get_model_type()
-            
+
             if model_type == ModelType.REALTIME:
                 await self._handle_realtime_response()
             elif model_type == ModelType.STREAMING:
                 await self._handle_streaming_response()
             else:
                 await self._handle_complete_response()
-                
+
+            # Cache the reply once every sentence of it has been voiced
+            await self._text_q.join()
+            clips = self._turn_clips
+            text = " ".join(sentence for _, sentence in clips)
+            if clips and len(clips) == self._turn_sentences:
+                self._response_cache[key] = (text, tuple(clips))
+                if len(self._response_cache) > self._response_cache_size:
+                    self._response_cache.popitem(last=False)
+            self._advance_history(user_message, text)
+
         except Exception as e:
-            print(f"❌ Error processing user input: {e}")
-    
+            logger.error("❌ Error processing user input: %s", e)
+
+    def _response_key(self, user_message: str) -> str:
+        key = "|".join((
+            self.config.llm.provider,
+            self.config.llm.model,
+            self.config.voice.voice,
+            self._history_digest.hex(),
+            user_message.strip().lower(),
+        ))
+        return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+    def _advance_history(self, user_message: str, reply: str):
+        """Fold a finished exchange into the digest the reply cache is keyed on"""
+        exchange = f"{user_message.strip().lower()}\0{reply}".encode()
+        self._history_digest = hashlib.blake2b(
+            self._history_digest + exchange, digest_size=16
+        ).digest()
+
+    async def _say(self, text: str):
+        """Queue a sentence of the current reply for TTS"""
+        self._turn_sentences += 1
+        await self._text_q.put((text, self._turn_clips))
+
     async def _handle_realtime_response(self):
         """Handle realtime streaming response (OpenAI style)"""
         print("🤖 Billy (realtime):")
         # TODO: Integrate existing OpenAI Realtime API handling here
         pass
-    
+
     async def _handle_streaming_response(self):
-        """Handle streaming response (Ollama style)"""
-        complete_text = ""
+        """Handle streaming response (Ollama/Kobold style)"""
+        pending = ""  # Text after the last complete sentence
         print("🤖 Billy: ", end="", flush=True)
-        
+
         try:
             async for chunk in self.llm_provider.get_response_stream():
                 if chunk["type"] == "text_delta":
                     text = chunk["text"]
-                    print(text, end="", flush=True)
-                    complete_text += text
+                    self._write_output(text)
+
+                    # Queue each sentence for voicing as soon as it is complete
+                    *sentences, pending = _SENTENCE_END.split(pending + text)
+                    for sentence in sentences:
+                        if sentence.strip():
+                            await self._say(sentence.strip())
+
+                    # Don't let a long run-on sentence hold up the voice: past the
+                    # batch size, voice it up to the last word break
+                    if len(pending) >= self.config.stream_batch_chars:
+                        head, _, pending = pending.rpartition(" ")
+                        if head.strip():
+                            await self._say(head.strip())
                 elif chunk["type"] == "error":
-                    print(f"\n❌ Error: {chunk['message']}")
+                    self._flush_output()
+                    logger.error("\n❌ Error: %s", chunk['message'])
                     return
-                elif chunk.get("done", False):
+                if chunk.get("done", False):
+                    self._flush_output()
                     print()  # New line
                     break
-            
-            # Generate voice response
-            if complete_text.strip():
-                await self._generate_voice_response(complete_text.strip())
-                
+
+            # Queue whatever is left after the last sentence
+            if pending.strip():
+                await self._say(pending.strip())
+
         except Exception as e:
-            print(f"\n❌ Error in streaming response: {e}")
-    
+            self._flush_output()
+            logger.error("\n❌ Error in streaming response: %s", e)
+
+    def _write_output(self, text: str):
+        """Buffer streamed text, flushing at sentence ends or every ~64 chars"""
+        self._out_buf.append(text)
+        self._out_len += len(text)
+        if self._out_len >= self._flush_threshold or _FLUSH_CHARS.search(text):
+            self._flush_output()
+
+    def _flush_output(self):
+        if self._out_buf:
+            sys.stdout.write("".join(self._out_buf))
+            sys.stdout.flush()
+            self._out_buf.clear()
+            self._out_len = 0
+
     async def _handle_complete_response(self):
-        """Handle complete response (Kobold style)"""
+        """Handle complete (request/response) provider replies"""
         try:
             async for response in self.llm_provider.get_response_stream():
                 if response["type"] == "text_complete":
                     text = response["text"]
                     if text.strip():
                         print(f"🤖 Billy: {text}")
-                        await self._generate_voice_response(text)
+                        await self._say(text)
                 elif response["type"] == "error":
-                    print(f"❌ Error: {response['message']}")
-                    
+                    logger.error("❌ Error: %s", response['message'])
+
         except Exception as e:
-            print(f"❌ Error in complete response: {e}")
-    
-    async def _generate_voice_response(self, text: str):
-        """Generate and play voice response"""
+            logger.error("❌ Error in complete response: %s", e)
+
+    async def _generate_voice_response(
+        self, text: str, out: asyncio.Queue
+    ) -> bytes | None:
+        """Stream a sentence's audio into ``out`` in ~20 ms PCM chunks"""
         if not self.voice_provider:
-            print("⚠️  No voice provider available")
-            return
-        
+            logger.warning("⚠️  No voice provider available")
+            return None
+
+        voice = self.config.voice
+        key = (voice.provider, voice.model, voice.voice, voice.speed, text)
+        audio_utils = _load_providers()["audio_utils"]
+        cached = self._tts_cache.get(key)
+        if cached is not None:
+            self._tts_cache.move_to_end(key)
+            step = audio_utils.PCM_CHUNK_BYTES
+            for start in range(0, len(cached), step):
+                out.put_nowait(cached[start : start + step])
+            return cached
+
         try:
-            print("🔊 Generating voice...")
-            
+            logger.debug("🔊 Generating voice...")
+
             voice_params = {
                 'voice': self.config.voice.voice,
-                'speed': self.config.voice.speed
+                'speed': self.config.voice.speed,
             }
-            
-            audio_data = await self.voice_provider.text_to_speech(text, voice_params)
-            
-            # TODO: Integrate with existing Billy Bass audio playback and motor control
-            await self._play_audio_with_animation(audio_data, text)
-            
+
+            # Playback starts on the first chunk instead of the whole utterance
+            chunks = []
+            stream = self.voice_provider.text_to_speech_stream(text, voice_params)
+            async for chunk in audio_utils.pcm16_chunks(stream):
+                chunks.append(chunk)
+                out.put_nowait(chunk)
+
+            audio = b"".join(chunks)
+            if audio and len(audio) <= self._tts_cache_max_bytes:
+                # The same sentence may have been rendered twice at once
+                replaced = self._tts_cache.pop(key, None)
+                if replaced is not None:
+                    self._tts_cache_bytes -= len(replaced)
+                self._tts_cache[key] = audio
+                self._tts_cache_bytes += len(audio)
+                while self._tts_cache_bytes > self._tts_cache_max_bytes:
+                    self._tts_cache_bytes -= len(self._tts_cache.popitem(last=False)[1])
+            return audio
+
         except Exception as e:
-            print(f"❌ Voice generation failed: {e}")
-    
+            logger.error("❌ Voice generation failed: %s", e)
+            return None
+
+    async def _tts_worker(self):
+        """Start synthesizing queued sentences until the None sentinel arrives"""
+        while (item := await self._text_q.get()) is not None:
+            text, clips = item
+            chunks = asyncio.Queue()
+            task = asyncio.create_task(self._render_sentence(text, chunks))
+            await self._render_q.put((task, chunks, text, clips))
+        await self._render_q.put(None)
+
+    async def _render_sentence(self, text: str, chunks: asyncio.Queue) -> bytes | None:
+        """Synthesize one sentence, at most four at a time, then close ``chunks``"""
+        try:
+            async with self._tts_limit:
+                return await self._generate_voice_response(text, chunks)
+        finally:
+            chunks.put_nowait(None)
+
+    async def _sequence_worker(self):
+        """Forward each sentence's audio to playback in the order it was queued"""
+        while (item := await self._render_q.get()) is not None:
+            task, chunks, text, clips = item
+            while (chunk := await chunks.get()) is not None:
+                await self._audio_q.put((chunk, text))
+            audio_data = await task
+            if audio_data is not None:
+                clips.append((audio_data, text))
+            self._text_q.task_done()
+        await self._audio_q.put(None)
+
+    async def _playback_worker(self):
+        """Play synthesized audio in order until the None sentinel arrives"""
+        playing = None
+        while (item := await self._audio_q.get()) is not None:
+            audio_data, text = item
+            if text is not playing:
+                logger.debug("🎵 Playing: %s", text)
+                playing = text
+            try:
+                await self._play_audio_with_animation(audio_data, text)
+            except Exception as e:
+                logger.error("❌ Audio playback failed: %s", e)
+
     async def _play_audio_with_animation(self, audio_data: bytes, text: str):
-        """Play audio with Billy Bass motor animation"""
-        print(f"🎵 Playing audio ({len(audio_data)} bytes)...")
-        
+        """Play a chunk of PCM audio with Billy Bass motor animation"""
+        # Loudness per 512-sample window, driving the mouth motor
+        audio_utils = _load_providers()["audio_utils"]
+        envelope = audio_utils.pcm16_to_envelope(
+            audio_utils.pcm16_from_audio(audio_data), 512
+        )
+
         # TODO: Integrate existing Billy Bass functionality:
-        # - Motor control for mouth movement
+        # - Motor control for mouth movement (from the envelope above)
         # - Tail movement
         # - Head movement
-        # - Audio playback through speakers
+        # - Audio playback through speakers (chunks arrive in order, ~20 ms each)
         # - Timing synchronization
-        
-        print("🎭 Animation complete")
-    
+
+    async def _ainput(self, prompt: str) -> str:
+        """Read a line from stdin in a worker thread so the event loop keeps running"""
+        return await asyncio.get_running_loop().run_in_executor(None, input, prompt)
+
     async def handle_button_press(self):
         """Handle physical button press"""
-        print("🔘 Button pressed - starting voice session...")
-        
+        logger.info("🔘 Button pressed - starting voice session...")
+
         # TODO: Integrate existing button handling and voice recording
         # This would typically:
         # 1. Record audio from microphone
         # 2. Convert speech to text (or use voice mode)
         # 3. Process the input
-        
+
         # For now, simulate with text input
-        user_input = input("💬 What would you like to say to Billy? ")
+        user_input = await self._ainput("💬 What would you like to say to Billy? ")
         if user_input.strip():
             await self.process_user_input(user_input)
-    
+
     async def shutdown(self):
         """Gracefully shutdown Billy Bass"""
-        print("🐟 Shutting down Billy Bass...")
-        
+        logger.info("🐟 Shutting down Billy Bass...")
+
         self.shutdown_requested = True
-        
+
+        # Let queued speech finish, then stop the pipeline workers
+        if self._workers:
+            await self._text_q.put(None)
+            await asyncio.gather(*self._workers, return_exceptions=True)
+            self._workers = []
+
         if self.llm_provider:
             await self.llm_provider.end_session()
-        
+        if self.voice_provider:
+            await self.voice_provider.aclose()
+
         # TODO: Cleanup hardware components
         # - Stop motor controllers
         # - Release GPIO pins
         # - Close audio devices
-        
-        print("👋 Billy Bass shutdown complete")
-    
+
+        # Last, since the providers above may still be using it
+        if providers_available():
+            await _load_providers()["close_http_session"]()
+
+        logger.info("👋 Billy Bass shutdown complete")
+
     async def run(self):
         """Main run loop"""
-        print("🚀 Billy Bass Assistant starting...")
-        
+        logger.info("🚀 Billy Bass Assistant starting...")
+
         if not await self.initialize():
-            print("❌ Failed to initialize Billy Bass")
+            logger.error("❌ Failed to initialize Billy Bass")
             return
-        
+
         print("🎤 Billy Bass is ready! Press button to start conversation.")
         print("💡 For testing, you can also type messages directly.")
-        
+
         try:
             while not self.shutdown_requested:
                 # TODO: Replace with actual button/voice detection
                 # For now, use simple input for testing
                 try:
-                    user_input = input("\n💬 Say something to Billy (or 'quit' to exit): ")
+                    user_input = await self._ainput(
+                        "\n💬 Say something to Billy (or 'quit' to exit): "
+                    )
                     if user_input.lower() in ['quit', 'exit', 'bye']:
                         break
-                    elif user_input.strip():
+                    if user_input.strip():
                         await self.process_user_input(user_input)
                 except KeyboardInterrupt:
                     break
                 except EOFError:
                     break
-                    
+
         except Exception as e:
-            print(f"❌ Error in main loop: {e}")
+            logger.error("❌ Error in main loop: %s", e)
         finally:
             await self.shutdown()
 
+
 # ============================================================================
 # UTILITY FUNCTIONS
 # ============================================================================
 
+
 def print_system_info():
     """Print system information and configuration"""
+    config = get_config()
     print("=" * 60)
     print("🐟 BILLY BASS ASSISTANT - MULTI-PROVIDER EDITION")
     print("=" * 60)
-    print(f"📡 LLM Provider: {CONFIG.llm.provider}")
-    print(f"🤖 Model: {CONFIG.llm.model}")
-    print(f"🔊 Voice Provider: {CONFIG.voice.provider}")
-    print(f"🎵 Voice: {CONFIG.voice.voice}")
-    print(f"🎛️  Billy Model: {CONFIG.billy_model}")
-    print(f"🔧 Debug Mode: {CONFIG.debug_mode}")
-    
-    if CONFIG.mqtt_host:
-        print(f"📡 MQTT: {CONFIG.mqtt_host}:{CONFIG.mqtt_port}")
-    if CONFIG.ha_host:
-        print(f"🏠 Home Assistant: {CONFIG.ha_host}")
-    
-    if PROVIDERS_AVAILABLE:
+    print(f"📡 LLM Provider: {config.llm.provider}")
+    print(f"🤖 Model: {config.llm.model}")
+    print(f"🔊 Voice Provider: {config.voice.provider}")
+    print(f"🎵 Voice: {config.voice.voice}")
+    print(f"🎛️  Billy Model: {config.billy_model}")
+    print(f"🔧 Debug Mode: {config.debug_mode}")
+
+    if config.mqtt.host:
+        print(f"📡 MQTT: {config.mqtt.host}:{config.mqtt.port}")
+    if config.home_assistant.host:
+        print(f"🏠 Home Assistant: {config.home_assistant.host}")
+
+    if providers_available():
+        ProviderFactory = _load_providers()["ProviderFactory"]
         available_llm = ProviderFactory.get_available_llm_providers()
         available_voice = ProviderFactory.get_available_voice_providers()
         print(f"🔌 Available LLM: {available_llm}")
         print(f"🔌 Available Voice: {available_voice}")
-    
+
     print("=" * 60)
 
+
 def setup_signal_handlers(billy):
     """Setup signal handlers for graceful shutdown"""
+    import signal
+
     def signal_handler(signum, frame):
-        print(f"\n🛑 Received signal {signum}")
+        logger.info("\n🛑 Received signal %s", signum)
         billy.shutdown_requested = True
-    
+
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+
 # ============================================================================
 # MAIN ENTRY POINT
 # ============================================================================
 
+
 async def main():
     """Main entry point"""
+    # Root stays at INFO so aiohttp/httpx/h2 don't log every request; debug
+    # mode only turns on Billy's own loggers
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+    if get_config().debug_mode:
+        for name in (__name__, "core", "providers"):
+            logging.getLogger(name).setLevel(logging.DEBUG)
     print_system_info()
-    
+
     # Create Billy Bass instance
     billy = BillyBassAssistant()
-    
+
     # Setup signal handlers
     setup_signal_handlers(billy)
-    
+
     # Run Billy Bass
     await billy.run()
 
+
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run_event_loop(main())
     except KeyboardInterrupt:
         print("\n👋 Billy Bass Assistant terminated")
     except Exception as e:
@@ -14,13 +14,17 @@ Voice Providers:
 - XTT/Coqui (via external server)
 """
 
-from .factory import ProviderFactory
 from .base import LLMProvider, ModelType
+from .factory import ProviderFactory
+from .http_session import close_http_session, get_http_session
 from .voice.base_voice import VoiceProvider
 
+
 __all__ = [
+    'LLMProvider',
+    'ModelType',
     'ProviderFactory',
-    'LLMProvider', 
     'VoiceProvider',
-    'ModelType'
-]
\ No newline at end of file
+    'close_http_session',
+    'get_http_session',
+]
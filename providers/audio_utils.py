@@ -0,0 +1,107 @@
+"""
+Audio helpers for Billy Bass playback
+
+pcm16_to_envelope turns synthesized speech into a per-window loudness envelope
+that drives the mouth motor. Numba is optional: with it installed the envelope
+is JIT-compiled (and cached to disk); without it a vectorized NumPy version is
+used instead.
+"""
+
+import io
+import wave
+from collections.abc import AsyncIterable, AsyncIterator
+
+import numpy as np
+
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+# 20 ms of 24 kHz mono PCM16, the format the TTS providers produce
+PCM_CHUNK_BYTES = 960
+
+
+def _wav_data_offset(buf: bytearray) -> int | None:
+    """Offset of the sample data in a WAV header, or None if not buffered yet"""
+    pos = 12
+    while pos + 8 <= len(buf):
+        if buf[pos : pos + 4] == b"data":
+            return pos + 8
+        pos += 8 + int.from_bytes(buf[pos + 4 : pos + 8], "little")
+    return None
+
+
+async def pcm16_chunks(
+    stream: AsyncIterable[bytes], chunk_bytes: int = PCM_CHUNK_BYTES
+) -> AsyncIterator[bytes]:
+    """Re-chunk a streamed WAV or raw PCM16 body into sample-aligned PCM chunks"""
+    buf = bytearray()
+    in_header = True
+    async for data in stream:
+        buf += data
+        if in_header:
+            if len(buf) < 4:
+                continue
+            if buf[:4] == b"RIFF":
+                offset = _wav_data_offset(buf)
+                if offset is None:
+                    continue
+                del buf[:offset]
+            in_header = False
+        end = len(buf) - len(buf) % chunk_bytes
+        for start in range(0, end, chunk_bytes):
+            yield bytes(buf[start : start + chunk_bytes])
+        del buf[:end]
+    if in_header and buf[:4] == b"RIFF":
+        return
+    if tail := len(buf) - len(buf) % 2:
+        yield bytes(buf[:tail])
+
+
+def pcm16_from_audio(audio_data: bytes) -> np.ndarray:
+    """Return the 16-bit samples from a WAV file or raw PCM16 bytes"""
+    if audio_data[:4] == b"RIFF":
+        with wave.open(io.BytesIO(audio_data)) as wav:
+            audio_data = wav.readframes(wav.getnframes())
+    return np.frombuffer(audio_data, dtype=np.int16, count=len(audio_data) // 2)
+
+
+def _envelope_numpy(pcm: np.ndarray, win: int) -> np.ndarray:
+    """RMS of each ``win``-sample window of ``pcm``, normalized to 0..1"""
+    samples = pcm.astype(np.float32) / 32768.0
+    full = len(samples) // win * win
+    env = np.sqrt(np.mean(np.square(samples[:full].reshape(-1, win)), axis=1))
+    if full < len(samples):
+        tail = np.sqrt(np.mean(np.square(samples[full:])))
+        env = np.append(env, tail)
+    return env.astype(np.float32)
+
+
+if numba is not None:
+
+    @numba.njit(cache=True, fastmath=True)
+    def pcm16_to_envelope(pcm: np.ndarray, win: int) -> np.ndarray:
+        """RMS of each ``win``-sample window of ``pcm``, normalized to 0..1"""
+        n = pcm.shape[0]
+        frames = (n + win - 1) // win
+        env = np.empty(frames, dtype=np.float32)
+        for f in range(frames):
+            start = f * win
+            stop = min(start + win, n)
+            acc = 0.0
+            for i in range(start, stop):
+                sample = pcm[i] / 32768.0
+                acc += sample * sample
+            env[f] = np.sqrt(acc / (stop - start))
+        return env
+
+else:
+    pcm16_to_envelope = _envelope_numpy
+
+
+def warmup() -> None:
+    """Compile pcm16_to_envelope ahead of the first reply"""
+    pcm16_to_envelope(np.zeros(1, dtype=np.int16), 1)
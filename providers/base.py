@@ -1,41 +1,48 @@
-from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional, AsyncGenerator
+from collections.abc import AsyncGenerator
 from enum import Enum
+from typing import Any, Protocol, runtime_checkable
+
 
 class ModelType(Enum):
     REALTIME = "realtime"
-    STREAMING = "streaming" 
+    STREAMING = "streaming"
     REQUEST_RESPONSE = "request_response"
 
-class LLMProvider(ABC):
-    """Abstract base class for all LLM providers"""
-    
-    @abstractmethod
-    async def initialize(self, config: Dict[str, Any]) -> bool:
+
+@runtime_checkable
+class LLMProvider(Protocol):
+    """Interface implemented by all LLM providers"""
+
+    # No per-instance __dict__; providers declare their attributes in __slots__
+    __slots__ = ()
+
+    # Config keys that must be set for ProviderFactory.validate_llm_config()
+    REQUIRED_CONFIG_KEYS: tuple[str, ...] = ()
+
+    async def initialize(self, config: dict[str, Any]) -> bool:
         """Initialize the provider with configuration"""
         pass
-    
-    @abstractmethod
+
     async def start_session(self) -> bool:
         """Start a new conversation session"""
         pass
-    
-    @abstractmethod
+
     async def send_message(self, message: str) -> None:
         """Send user message to the model"""
         pass
-    
-    @abstractmethod
-    async def get_response_stream(self) -> AsyncGenerator[Dict[str, Any], None]:
+
+    async def add_exchange(self, message: str, reply: str) -> None:
+        """Record a turn the model didn\'t answer, e.g. a cached reply"""
+        pass
+
+    async def get_response_stream(self) -> AsyncGenerator[dict[str, Any], None]:
         """Get streaming response from model"""
         pass
-    
-    @abstractmethod
+
     async def end_session(self) -> None:
         """End the current session"""
         pass
-    
-    @abstractmethod
+
     def get_model_type(self) -> ModelType:
         """Return the type of model interaction"""
-        pass
\ No newline at end of file
+        pass
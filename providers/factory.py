@@ -1,106 +1,141 @@
-from typing import Dict, Any, List
+import asyncio
+import functools
+import importlib
+import logging
+import sys
+from types import MappingProxyType
+from typing import Any
+
 from .base import LLMProvider
 from .voice.base_voice import VoiceProvider
 
-# Import LLM providers
-from .openai_provider import OpenAIProvider
-from .ollama_provider import OllamaProvider
-from .kobold_provider import KoboldProvider
 
-# Import voice providers
-from .voice.openai_voice import OpenAIVoiceProvider
-from .voice.chatterai_voice import ChatterAIVoiceProvider
-from .voice.xtt_voice import XTTVoiceProvider
+logger = logging.getLogger(__name__)
+
+
+def _canon(name: str) -> str:
+    """Canonical (interned, lowercase) form of a provider name"""
+    return sys.intern(name.strip().lower())
+
+
+# Provider modules are imported on first use, so only the selected providers
+# (and their dependencies) are loaded at startup
+def _registry(providers: dict[str, tuple[str, str]]) -> MappingProxyType:
+    """Freeze a provider registry, interning its lowercase names"""
+    return MappingProxyType({_canon(name): path for name, path in providers.items()})
+
+
+@functools.cache
+def _load_class(module_name: str, class_name: str) -> type:
+    """Import a provider class from its (module, class) registry entry"""
+    return getattr(importlib.import_module(module_name, __package__), class_name)
+
 
 class ProviderFactory:
     """Factory for creating and managing LLM and Voice providers"""
-    
+
     # Registry of available LLM providers
-    LLM_PROVIDERS = {
-        'openai': OpenAIProvider,
-        'ollama': OllamaProvider,
-        'kobold': KoboldProvider
-    }
-    
+    LLM_PROVIDERS = _registry({
+        'openai': ('.openai_provider', 'OpenAIProvider'),
+        'ollama': ('.ollama_provider', 'OllamaProvider'),
+        'kobold': ('.kobold_provider', 'KoboldProvider'),
+    })
+
     # Registry of available voice providers
-    VOICE_PROVIDERS = {
-        'openai': OpenAIVoiceProvider,
-        'chatterai': ChatterAIVoiceProvider,
-        'xtt': XTTVoiceProvider
-    }
-    
+    VOICE_PROVIDERS = _registry({
+        'openai': ('.voice.openai_voice', 'OpenAIVoiceProvider'),
+        'chatterai': ('.voice.chatterai_voice', 'ChatterAIVoiceProvider'),
+        'xtt': ('.voice.xtt_voice', 'XTTVoiceProvider'),
+    })
+
     @staticmethod
-    async def create_llm_provider(config: Dict[str, Any]) -> LLMProvider:
+    async def create_llm_provider(config: dict[str, Any]) -> LLMProvider:
         """Create and initialize LLM provider"""
-        provider_name = config.get('provider', 'openai').lower()
-        
+        provider_name = _canon(config.get('provider', 'openai'))
+
         if provider_name not in ProviderFactory.LLM_PROVIDERS:
             available = list(ProviderFactory.LLM_PROVIDERS.keys())
-            raise ValueError(f"Unknown LLM provider '{provider_name}'. Available: {available}")
-        
-        print(f"🔧 Creating LLM provider: {provider_name}")
-        
-        provider_class = ProviderFactory.LLM_PROVIDERS[provider_name]
+            raise ValueError(
+                f"Unknown LLM provider '{provider_name}'. Available: {available}"
+            )
+
+        logger.info("🔧 Creating LLM provider: %s", provider_name)
+
+        provider_class = _load_class(*ProviderFactory.LLM_PROVIDERS[provider_name])
         provider = provider_class()
-        
+
         if await provider.initialize(config):
-            print(f"✅ LLM provider '{provider_name}' initialized successfully")
+            logger.info("✅ LLM provider '%s' initialized successfully", provider_name)
             return provider
-        else:
-            raise ConnectionError(f"Failed to initialize LLM provider '{provider_name}'")
-    
+        raise ConnectionError(f"Failed to initialize LLM provider '{provider_name}'")
+
     @staticmethod
-    async def create_voice_provider(config: Dict[str, Any]) -> VoiceProvider:
+    async def create_voice_provider(config: dict[str, Any]) -> VoiceProvider:
         """Create and initialize Voice provider"""
-        provider_name = config.get('provider', 'openai').lower()
-        
+        provider_name = _canon(config.get('provider', 'openai'))
+
         if provider_name not in ProviderFactory.VOICE_PROVIDERS:
             available = list(ProviderFactory.VOICE_PROVIDERS.keys())
-            raise ValueError(f"Unknown Voice provider '{provider_name}'. Available: {available}")
-        
-        print(f"🔧 Creating Voice provider: {provider_name}")
-        
-        provider_class = ProviderFactory.VOICE_PROVIDERS[provider_name]
+            raise ValueError(
+                f"Unknown Voice provider '{provider_name}'. Available: {available}"
+            )
+
+        logger.info("🔧 Creating Voice provider: %s", provider_name)
+
+        provider_class = _load_class(*ProviderFactory.VOICE_PROVIDERS[provider_name])
         provider = provider_class()
-        
+
         if await provider.initialize(config):
-            print(f"✅ Voice provider '{provider_name}' initialized successfully")
+            logger.info(
+                "✅ Voice provider '%s' initialized successfully", provider_name
+            )
             return provider
-        else:
-            raise ConnectionError(f"Failed to initialize Voice provider '{provider_name}'")
-    
+        raise ConnectionError(f"Failed to initialize Voice provider '{provider_name}'")
+
     @staticmethod
-    def get_available_llm_providers() -> List[str]:
+    async def preload(llm_provider: str, voice_provider: str) -> None:
+        """Import the selected provider modules in a worker thread"""
+        loop = asyncio.get_running_loop()
+        entries = [
+            ProviderFactory.LLM_PROVIDERS.get(_canon(llm_provider)),
+            ProviderFactory.VOICE_PROVIDERS.get(_canon(voice_provider)),
+        ]
+        # Failures surface later, when create_*_provider imports the class
+        await asyncio.gather(
+            *(
+                loop.run_in_executor(None, _load_class, *entry)
+                for entry in entries
+                if entry
+            ),
+            return_exceptions=True,
+        )
+
+    @staticmethod
+    def get_available_llm_providers() -> list[str]:
         """Get list of available LLM providers"""
         return list(ProviderFactory.LLM_PROVIDERS.keys())
-    
-    @staticmethod  
-    def get_available_voice_providers() -> List[str]:
+
+    @staticmethod
+    def get_available_voice_providers() -> list[str]:
         """Get list of available Voice providers"""
         return list(ProviderFactory.VOICE_PROVIDERS.keys())
-    
+
     @staticmethod
-    def validate_llm_config(config: Dict[str, Any]) -> bool:
+    def validate_llm_config(config: dict[str, Any]) -> bool:
         """Validate LLM provider configuration"""
-        provider_name = config.get('provider', 'openai').lower()
-        
-        if provider_name == 'openai':
-            return bool(config.get('api_key'))
-        elif provider_name == 'ollama':
-            return bool(config.get('api_url'))
-        elif provider_name == 'kobold':
-            return bool(config.get('api_url'))
-        
-        return False
-    
+        entry = ProviderFactory.LLM_PROVIDERS.get(
+            _canon(config.get('provider', 'openai'))
+        )
+        return entry is not None and all(
+            config.get(key) for key in _load_class(*entry).REQUIRED_CONFIG_KEYS
+        )
+
     @staticmethod
-    def validate_voice_config(config: Dict[str, Any]) -> bool:
+    def validate_voice_config(config: dict[str, Any]) -> bool:
         """Validate Voice provider configuration"""
-        provider_name = config.get('provider', 'openai').lower()
-        
-        if provider_name == 'openai':
-            return bool(config.get('api_key'))
-        elif provider_name in ['chatterai', 'xtt']:
-            return bool(config.get('api_url'))
-        
-        return False
\ No newline at end of file
+        entry = ProviderFactory.VOICE_PROVIDERS.get(
+            _canon(config.get('provider', 'openai'))
+        )
+        return entry is not None and all(
+            config.get(key) for key in _load_class(*entry).REQUIRED_CONFIG_KEYS
+        )
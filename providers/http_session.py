@@ -0,0 +1,101 @@
+from collections.abc import Mapping
+from typing import Optional
+
+import aiohttp
+from multidict import CIMultiDict, CIMultiDictProxy
+
+
+try:
+    import h2  # noqa: F401 - required by httpx for http2=True
+    import httpx
+except ImportError:
+    httpx = None
+
+# One connector pool (and DNS cache) shared by every HTTP-based provider; the
+# LLM and TTS servers usually live on the same host.
+#
+# No socket options are set here: aiohttp already enables TCP_NODELAY on every
+# connection it opens, and fixed SO_SNDBUF/SO_RCVBUF sizes would only disable
+# the kernel's buffer autotuning for these small requests.
+_shared_session: aiohttp.ClientSession | None = None
+
+# Optional HTTP/2 client for HTTPS APIs that support it, so parallel requests
+# are multiplexed over one connection
+_http2_client: Optional["httpx.AsyncClient"] = None
+
+
+def frozen_headers(
+    headers: Mapping[str, str], content_type: str | None = None
+) -> CIMultiDictProxy:
+    """Read-only headers in the form aiohttp uses, so requests skip the conversion"""
+    result = CIMultiDict(headers)
+    if content_type:
+        result['Content-Type'] = content_type
+    return CIMultiDictProxy(result)
+
+
+# Headers for JSON request bodies sent with data=
+JSON_HEADERS = frozen_headers({}, 'application/json')
+
+
+async def get_http_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use
+
+    Nothing is awaited between the check and the assignment, so providers
+    initialized concurrently still end up with the same session.
+    """
+    global _shared_session
+    if _shared_session is None or _shared_session.closed:
+        _shared_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=16, limit_per_host=8, ttl_dns_cache=300, keepalive_timeout=75
+            ),
+            # No cap on the whole request: LLM replies and TTS bodies stream for
+            # as long as they need, but a stalled connection still times out
+            timeout=aiohttp.ClientTimeout(total=None, sock_connect=15, sock_read=120),
+            # Responses are decompressed transparently; aiohttp advertises
+            # Accept-Encoding: gzip, deflate (plus br when Brotli is installed)
+            auto_decompress=True,
+        )
+    return _shared_session
+
+
+def get_http2_client() -> Optional["httpx.AsyncClient"]:
+    """Return the shared HTTP/2 client, or None if httpx[http2] isn't installed"""
+    global _http2_client
+    if httpx is None:
+        return None
+    if _http2_client is None or _http2_client.is_closed:
+        _http2_client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=8, max_keepalive_connections=8),
+            timeout=60.0,
+        )
+    return _http2_client
+
+
+async def close_http_session() -> None:
+    """Close the shared HTTP session and client (called once at shutdown)"""
+    global _shared_session, _http2_client
+    if _shared_session is not None:
+        await _shared_session.close()
+        _shared_session = None
+    if _http2_client is not None:
+        await _http2_client.aclose()
+        _http2_client = None
+
+
+async def read_error_text(resp: aiohttp.ClientResponse, limit: int = 4096) -> str:
+    """Decode at most ``limit`` bytes of an error response body"""
+    raw = await resp.content.read(limit)
+    return raw.decode('utf-8', errors='replace')
+
+
+async def read_http2_error_text(resp: "httpx.Response", limit: int = 4096) -> str:
+    """read_error_text() for a streamed httpx response"""
+    raw = bytearray()
+    async for chunk in resp.aiter_bytes():
+        raw += chunk
+        if len(raw) >= limit:
+            break
+    return raw[:limit].decode('utf-8', errors='replace')
@@ -0,0 +1,23 @@
+"""
+JSON encoding for provider requests and responses
+
+Uses orjson when it is installed and falls back to the standard library.
+dumps() always returns bytes, ready to send as a request body, and loads()
+accepts bytes directly.
+"""
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    dumps = orjson.dumps
+    loads = orjson.loads
+else:
+    import json
+
+    def dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    loads = json.loads
@@ -1,119 +1,265 @@
+import asyncio
+import functools
+import logging
+import sys
+from collections import deque
+from collections.abc import AsyncGenerator
+from typing import Any
+
 import aiohttp
-from typing import Dict, Any, AsyncGenerator
+
+from . import jsonutil
 from .base import LLMProvider, ModelType
+from .http_session import JSON_HEADERS, get_http_session, read_error_text
+
+
+try:
+    import tiktoken
+except ImportError:
+    tiktoken = None
+
+logger = logging.getLogger(__name__)
+
+# Speaker labels of the plain-text transcript sent to Kobold
+_USER = sys.intern("User: ")
+_ASSISTANT = sys.intern("Assistant:")
+
+
+@functools.cache
+def _encoder():
+    """The tiktoken encoding used to size history lines, or None
+
+    get_encoding() may download its BPE file, so this is first called from a
+    worker thread in initialize() rather than on the event loop.
+    """
+    if tiktoken is None:
+        return None
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:  # e.g. the BPE file can't be downloaded offline
+        logger.warning("⚠️  tiktoken unavailable, estimating tokens: %s", e)
+        return None
+
+
+def _count_tokens(text: str) -> int:
+    """Estimated token count of a history line, plus one for its newline
+
+    cl100k_base isn't the served model's tokenizer, so counts are only close
+    enough to budget the context window.
+    """
+    encoder = _encoder()
+    if encoder is None:
+        return len(text) // 4 + 1  # Roughly four characters per token
+    return len(encoder.encode(text)) + 1
+
 
 class KoboldProvider(LLMProvider):
     """Client-only Kobold provider - connects to external Kobold server"""
-    
+
+    REQUIRED_CONFIG_KEYS = ('api_url',)
+
+    __slots__ = (
+        'api_url',
+        'temperature',
+        'max_tokens',
+        'max_context',
+        'system_prompt',
+        'conversation_history',
+        '_line_tokens',
+        '_history_tokens',
+        '_reserved_tokens',
+        '_joined_prefix',
+        '_max_turns',
+        '_system_prefix',
+        '_session',
+    )
+
     def __init__(self):
         self.api_url = None
         self.temperature = 0.7
         self.max_tokens = 150
         self.max_context = 2048
-        self.conversation_history = []
-    
-    async def initialize(self, config: Dict[str, Any]) -> bool:
+        self.system_prompt = ""
+        self.conversation_history: deque[str] = deque()
+        self._line_tokens: deque[int] = deque()  # Token count per history line
+        self._history_tokens = 0  # sum(_line_tokens)
+        self._reserved_tokens = 0  # System prefix and "Assistant:" suffix
+        self._joined_prefix = ""  # "\n".join(conversation_history), kept up to date
+        self._max_turns = 16  # History lines kept between turns
+        self._system_prefix = ""  # System prompt fixed for the session
+        self._session: aiohttp.ClientSession | None = None
+
+    async def initialize(self, config: dict[str, Any]) -> bool:
         """Initialize connection to external Kobold server"""
         self.api_url = config.get('api_url', 'http://localhost:5000')
         self.temperature = config.get('temperature', 0.7)
         self.max_tokens = config.get('max_tokens', 150)
         self.max_context = config.get('max_context', 2048)
-        
+        self.system_prompt = config.get('system_prompt') or ""
+
+        # Pooled session shared with the other HTTP providers, so turns reuse sockets
+        self._session = await get_http_session()
+
+        # Load the tokenizer off the event loop (it may need a download)
+        await asyncio.to_thread(_encoder)
+
         # Test connection to external Kobold server
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.get(f"{self.api_url}/api/v1/model") as resp:
-                    if resp.status == 200:
-                        model_info = await resp.json()
-                        model_name = model_info.get('result', 'Unknown Model')
-                        print(f"✅ Connected to Kobold server at {self.api_url}")
-                        print(f"🤖 Loaded model: {model_name}")
-                        return True
-                    else:
-                        print(f"❌ Kobold server returned status {resp.status}")
-                        return False
+            async with self._session.get(f"{self.api_url}/api/v1/model") as resp:
+                if resp.status == 200:
+                    model_info = jsonutil.loads(await resp.read())
+                    model_name = model_info.get('result', 'Unknown Model')
+                    logger.info("✅ Connected to Kobold server at %s", self.api_url)
+                    logger.info("🤖 Loaded model: %s", model_name)
+                    return True
+                logger.error(
+                    "❌ Kobold server returned status %s: %s",
+                    resp.status,
+                    await read_error_text(resp),
+                )
+                return False
         except Exception as e:
-            print(f"❌ Failed to connect to Kobold server at {self.api_url}: {e}")
+            logger.error(
+                "❌ Failed to connect to Kobold server at %s: %s", self.api_url, e
+            )
             return False
-    
+
     async def start_session(self) -> bool:
         """Start new conversation session"""
-        self.conversation_history = []
-        print(f"🐟 Billy started new Kobold session")
+        self.conversation_history.clear()
+        self._line_tokens.clear()
+        self._history_tokens = 0
+        self._joined_prefix = ""
+        self._system_prefix = self.system_prompt.strip()
+        self._reserved_tokens = _count_tokens(_ASSISTANT)
+        if self._system_prefix:
+            self._reserved_tokens += _count_tokens(self._system_prefix)
+        logger.info("🐟 Billy started new Kobold session")
         return True
-    
+
     async def send_message(self, message: str) -> None:
         """Add user message to conversation"""
-        self.conversation_history.append(f"User: {message}")
-        print(f"👤 User: {message}")
-    
-    async def get_response_stream(self) -> AsyncGenerator[Dict[str, Any], None]:
-        """Get response from external Kobold server"""
+        self._append_history(_USER + message)
+        logger.debug("👤 User: %s", message)
+
+    async def add_exchange(self, message: str, reply: str) -> None:
+        """Add a turn answered from the reply cache to the conversation"""
+        self._append_history(_USER + message)
+        self._append_history(f"{_ASSISTANT} {reply}")
+
+    def _append_history(self, line: str) -> None:
+        tokens = _count_tokens(line)
+        self.conversation_history.append(line)
+        self._line_tokens.append(tokens)
+        self._history_tokens += tokens
+        self._joined_prefix = (
+            f"{self._joined_prefix}\n{line}" if self._joined_prefix else line
+        )
+        if len(self.conversation_history) > self._max_turns:
+            while len(self.conversation_history) > self._max_turns:
+                self._drop_oldest()
+            self._rebuild_prefix()
+
+    def _drop_oldest(self) -> None:
+        self.conversation_history.popleft()
+        self._history_tokens -= self._line_tokens.popleft()
+
+    def _rebuild_prefix(self) -> None:
+        self._joined_prefix = "\n".join(self.conversation_history)
+
+    async def get_response_stream(self) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream the response from external Kobold server token by token"""
+        # Drop the oldest turns until prompt and reply fit the context window
+        history = self.conversation_history
+        budget = self.max_context - self.max_tokens - self._reserved_tokens
+        if self._history_tokens > budget and len(history) > 2:
+            while self._history_tokens > budget and len(history) > 2:
+                self._drop_oldest()
+            self._rebuild_prefix()
+
         # Format conversation for Kobold (simple text format)
-        prompt = "\n".join(self.conversation_history) + "\nAssistant:"
-        
-        # Truncate if too long for context window
-        if len(prompt) > self.max_context:
-            # Keep recent conversation history
-            lines = prompt.split('\n')
-            while len('\n'.join(lines)) > self.max_context and len(lines) > 2:
-                lines.pop(0)
-            prompt = '\n'.join(lines)
-        
+        if self._system_prefix:
+            prompt = "\n".join((self._system_prefix, self._joined_prefix, _ASSISTANT))
+        else:
+            prompt = "\n".join((self._joined_prefix, _ASSISTANT))
+
         payload = {
             "prompt": prompt,
             "max_length": self.max_tokens,
+            "max_context_length": self.max_context,
             "temperature": self.temperature,
             "rep_pen": 1.1,
             "top_p": 0.9,
             "top_k": 40,
-            "sampler_order": [6, 0, 1, 2, 3, 4, 5]
+            "sampler_order": [6, 0, 1, 2, 3, 4, 5],
         }
-        
+
         try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/api/v1/generate",
-                    json=payload,
-                    headers={'Content-Type': 'application/json'}
-                ) as resp:
-                    if resp.status == 200:
-                        data = await resp.json()
-                        response_text = data.get('results', [{}])[0].get('text', '').strip()
-                        
-                        if response_text:
+            async with self._session.post(
+                f"{self.api_url}/api/extra/generate/stream",
+                data=jsonutil.dumps(payload),
+                headers=JSON_HEADERS,
+            ) as resp:
+                if resp.status == 200:
+                    echo = _ASSISTANT
+                    pending = ""  # Leading text held back until any echo is stripped
+                    echo_checked = False
+                    parts = []
+
+                    # Server-sent events: one "data: {"token": ...}" line per token
+                    async for line in resp.content:
+                        if not line.startswith(b"data:"):
+                            continue
+                        try:
+                            token = jsonutil.loads(line[5:]).get('token', '')
+                        except ValueError:
+                            continue
+
+                        if not echo_checked:
                             # Clean up the response (remove any prompt echoing)
-                            if response_text.startswith('Assistant:'):
-                                response_text = response_text[10:].strip()
-                            
-                            # Add to conversation history
-                            self.conversation_history.append(f"Assistant: {response_text}")
-                            print(f"🤖 Billy: {response_text}")
-                        
-                        # Kobold returns complete response (not streaming)
-                        yield {
-                            "type": "text_complete", 
-                            "text": response_text,
-                            "done": True
-                        }
-                        
-                    else:
-                        error_text = await resp.text()
-                        yield {
-                            "type": "error", 
-                            "message": f"Kobold server error {resp.status}: {error_text}"
-                        }
-                        
+                            pending += token
+                            head = pending.lstrip()
+                            if len(head) < len(echo) and echo.startswith(head):
+                                continue
+                            token = head.removeprefix(echo).lstrip()
+                            echo_checked = True
+
+                        if token:
+                            parts.append(token)
+                            yield {"type": "text_delta", "text": token, "done": False}
+
+                    if not echo_checked and pending.strip():
+                        parts.append(pending.strip())
+                        yield {"type": "text_delta", "text": parts[-1], "done": False}
+
+                    # Add to conversation history once the reply is complete
+                    response_text = "".join(parts).strip()
+                    if response_text:
+                        self._append_history(f"{_ASSISTANT} {response_text}")
+
+                    yield {"type": "text_delta", "text": "", "done": True}
+                    return
+
+                # Read a bounded slice of the error body; report it once the
+                # connection is back in the pool
+                error = (
+                    f"Kobold server error {resp.status}: {await read_error_text(resp)}"
+                )
+
         except Exception as e:
             yield {
-                "type": "error", 
-                "message": f"Connection error to Kobold server: {e}"
+                "type": "error",
+                "message": f"Connection error to Kobold server: {e}",
             }
-    
+            return
+
+        yield {"type": "error", "message": error}
+
     async def end_session(self) -> None:
         """End the current session"""
-        print(f"🐟 Billy ended Kobold session")
-        pass
-    
+        # The shared HTTP session is closed by the assistant at shutdown
+        self._session = None
+        logger.info("🐟 Billy ended Kobold session")
+
     def get_model_type(self) -> ModelType:
-        return ModelType.REQUEST_RESPONSE
\ No newline at end of file
+        return ModelType.STREAMING
@@ -1,89 +1,159 @@
-import asyncio
-import json
-from typing import Dict, Any, AsyncGenerator
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import aiohttp
+
+from . import jsonutil
 from .base import LLMProvider, ModelType
+from .http_session import JSON_HEADERS, get_http_session, read_error_text
+
+
+logger = logging.getLogger(__name__)
+
+
+class OllamaProvider(LLMProvider):
+    """Client-only Ollama provider - connects to external Ollama server"""
+
+    REQUIRED_CONFIG_KEYS = ('api_url',)
 
-# Note: This provider maintains compatibility with existing Billy Bass OpenAI integration
-# The actual OpenAI Realtime API implementation should be moved from main.py to here
+    __slots__ = (
+        'api_url',
+        'model',
+        'temperature',
+        'max_tokens',
+        'system_prompt',
+        'messages',
+        '_session',
+    )
 
-class OpenAIProvider(LLMProvider):
-    """OpenAI provider - supports GPT-4, GPT-5, and Realtime API"""
-    
     def __init__(self):
-        self.api_key = None
-        self.model = None
         self.api_url = None
-        self.organization = None
-        self.project_id = None
-        # Note: OpenAI client initialization will be moved here from main.py
-    
-    async def initialize(self, config: Dict[str, Any]) -> bool:
-        """Initialize OpenAI connection"""
-        self.api_key = config.get('api_key')
-        self.model = config.get('model', 'gpt-4o-mini-realtime-preview')
-        self.api_url = config.get('api_url')  # For Azure OpenAI, custom endpoints
-        self.organization = config.get('organization')
-        self.project_id = config.get('project_id')
-        
-        if not self.api_key:
-            print("❌ OpenAI API key not provided")
+        self.model = None
+        self.temperature = 0.7
+        self.max_tokens = 150
+        self.system_prompt = ""
+        self.messages: list[dict[str, str]] = []
+        self._session: aiohttp.ClientSession | None = None
+
+    async def initialize(self, config: dict[str, Any]) -> bool:
+        """Initialize connection to external Ollama server"""
+        self.api_url = (config.get('api_url') or 'http://localhost:11434').rstrip('/')
+        self.model = config.get('model') or 'llama3.2:latest'
+        self.temperature = config.get('temperature', 0.7)
+        self.max_tokens = config.get('max_tokens', 150)
+        self.system_prompt = config.get('system_prompt') or ""
+
+        # Pooled session shared with the other HTTP providers, so turns reuse sockets
+        self._session = await get_http_session()
+
+        # Test connection to external Ollama server
+        try:
+            async with self._session.get(f"{self.api_url}/api/tags") as resp:
+                if resp.status == 200:
+                    logger.info("✅ Connected to Ollama server at %s", self.api_url)
+                    logger.info("🤖 Using model: %s", self.model)
+                    return True
+                logger.error(
+                    "❌ Ollama server returned status %s: %s",
+                    resp.status,
+                    await read_error_text(resp),
+                )
+                return False
+        except Exception as e:
+            logger.error(
+                "❌ Failed to connect to Ollama server at %s: %s", self.api_url, e
+            )
             return False
-        
-        # Validate GPT-5 access if requested
-        if "gpt-5" in self.model.lower():
-            print(f"🚀 Attempting to use GPT-5 model: {self.model}")
-            # Note: Add GPT-5 availability check here when API is released
-        
-        print(f"✅ OpenAI provider initialized with model: {self.model}")
-        return True
-    
+
     async def start_session(self) -> bool:
-        """Start new OpenAI Realtime session"""
-        print(f"🐟 Billy started new OpenAI session with {self.model}")
-        # Note: Existing OpenAI Realtime session logic from main.py goes here
+        """Start new conversation session"""
+        self.messages.clear()
+        if self.system_prompt.strip():
+            self.messages.append({
+                "role": "system",
+                "content": self.system_prompt.strip(),
+            })
+        logger.info("🐟 Billy started new Ollama session with %s", self.model)
         return True
-    
+
     async def send_message(self, message: str) -> None:
-        """Send message to OpenAI Realtime API"""
-        print(f"👤 User: {message}")
-        # Note: Existing OpenAI message sending logic from main.py goes here
-        pass
-    
-    async def get_response_stream(self) -> AsyncGenerator[Dict[str, Any], None]:
-        """Get streaming response from OpenAI Realtime API"""
-        # Note: This is a placeholder - the actual OpenAI Realtime API integration
-        # should be moved from main.py to this method
-        
-        # For now, yield a placeholder response
-        yield {
-            "type": "text_delta",
-            "text": "OpenAI provider needs integration with existing Realtime API code from main.py",
-            "done": False
-        }
-        
-        yield {
-            "type": "text_delta", 
-            "text": "",
-            "done": True
+        """Add user message to conversation"""
+        self.messages.append({"role": "user", "content": message})
+        logger.debug("👤 User: %s", message)
+
+    async def add_exchange(self, message: str, reply: str) -> None:
+        """Add a turn answered from the reply cache to the conversation"""
+        self.messages.append({"role": "user", "content": message})
+        self.messages.append({"role": "assistant", "content": reply})
+
+    async def get_response_stream(self) -> AsyncGenerator[dict[str, Any], None]:
+        """Stream the response from external Ollama server"""
+        payload = {
+            "model": self.model,
+            "messages": self.messages,
+            "stream": True,
+            "options": {
+                "temperature": self.temperature,
+                "num_predict": self.max_tokens,
+            },
         }
-    
+
+        try:
+            async with self._session.post(
+                f"{self.api_url}/api/chat",
+                data=jsonutil.dumps(payload),
+                headers=JSON_HEADERS,
+            ) as resp:
+                if resp.status == 200:
+                    parts = []
+
+                    # Newline-delimited JSON: one {"message": {...}, "done": ...} per line
+                    async for line in resp.content:
+                        if not line.strip():
+                            continue
+                        try:
+                            frame = jsonutil.loads(line)
+                        except ValueError:
+                            continue
+                        token = frame.get('message', {}).get('content', '')
+                        if token:
+                            parts.append(token)
+                            yield {"type": "text_delta", "text": token, "done": False}
+                        if frame.get('done'):
+                            break
+
+                    # Add to conversation history once the reply is complete
+                    response_text = "".join(parts).strip()
+                    if response_text:
+                        self.messages.append({
+                            "role": "assistant",
+                            "content": response_text,
+                        })
+
+                    yield {"type": "text_delta", "text": "", "done": True}
+                    return
+
+                # Read a bounded slice of the error body; report it once the
+                # connection is back in the pool
+                error = (
+                    f"Ollama server error {resp.status}: {await read_error_text(resp)}"
+                )
+
+        except Exception as e:
+            yield {
+                "type": "error",
+                "message": f"Connection error to Ollama server: {e}",
+            }
+            return
+
+        yield {"type": "error", "message": error}
+
     async def end_session(self) -> None:
-        """End OpenAI Realtime session"""
-        print(f"🐟 Billy ended OpenAI session")
-        # Note: Existing OpenAI session cleanup logic from main.py goes here
-        pass
-    
+        """End the current session"""
+        # The shared HTTP session is closed by the assistant at shutdown
+        self._session = None
+        logger.info("🐟 Billy ended Ollama session")
+
     def get_model_type(self) -> ModelType:
-        return ModelType.REALTIME
-    
-    def is_gpt5(self) -> bool:
-        """Check if using GPT-5"""
-        return "gpt-5" in self.model.lower()
-    
-    def get_model_version(self) -> str:
-        """Get model version (4, 5, etc.)"""
-        if "gpt-5" in self.model.lower():
-            return "5"
-        elif "gpt-4" in self.model.lower():
-            return "4"
-        return "unknown"
\ No newline at end of file
+        return ModelType.STREAMING
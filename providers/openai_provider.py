@@ -0,0 +1,94 @@
+import logging
+from collections.abc import AsyncGenerator
+from typing import Any
+
+from .base import LLMProvider, ModelType
+
+
+logger = logging.getLogger(__name__)
+
+# Note: This provider maintains compatibility with existing Billy Bass OpenAI integration
+# The actual OpenAI Realtime API implementation should be moved from main.py to here
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI provider - supports GPT-4, GPT-5, and Realtime API"""
+
+    REQUIRED_CONFIG_KEYS = ('api_key',)
+
+    __slots__ = ('api_key', 'model', 'api_url', 'organization', 'project_id')
+
+    def __init__(self):
+        self.api_key = None
+        self.model = None
+        self.api_url = None
+        self.organization = None
+        self.project_id = None
+        # Note: OpenAI client initialization will be moved here from main.py
+
+    async def initialize(self, config: dict[str, Any]) -> bool:
+        """Initialize OpenAI connection"""
+        self.api_key = config.get('api_key')
+        self.model = config.get('model', 'gpt-4o-mini-realtime-preview')
+        self.api_url = config.get('api_url')  # For Azure OpenAI, custom endpoints
+        self.organization = config.get('organization')
+        self.project_id = config.get('project_id')
+
+        if not self.api_key:
+            logger.error("❌ OpenAI API key not provided")
+            return False
+
+        # Validate GPT-5 access if requested
+        if "gpt-5" in self.model.lower():
+            logger.info("🚀 Attempting to use GPT-5 model: %s", self.model)
+            # Note: Add GPT-5 availability check here when API is released
+
+        logger.info("✅ OpenAI provider initialized with model: %s", self.model)
+        return True
+
+    async def start_session(self) -> bool:
+        """Start new OpenAI Realtime session"""
+        logger.info("🐟 Billy started new OpenAI session with %s", self.model)
+        # Note: Existing OpenAI Realtime session logic from main.py goes here
+        return True
+
+    async def send_message(self, message: str) -> None:
+        """Send message to OpenAI Realtime API"""
+        logger.debug("👤 User: %s", message)
+        # Note: Existing OpenAI message sending logic from main.py goes here
+        pass
+
+    async def get_response_stream(self) -> AsyncGenerator[dict[str, Any], None]:
+        """Get streaming response from OpenAI Realtime API"""
+        # Note: This is a placeholder - the actual OpenAI Realtime API integration
+        # should be moved from main.py to this method
+
+        # For now, yield a placeholder response
+        yield {
+            "type": "text_delta",
+            "text": "OpenAI provider needs integration with existing Realtime API code from main.py",
+            "done": False,
+        }
+
+        yield {"type": "text_delta", "text": "", "done": True}
+
+    async def end_session(self) -> None:
+        """End OpenAI Realtime session"""
+        logger.info("🐟 Billy ended OpenAI session")
+        # Note: Existing OpenAI session cleanup logic from main.py goes here
+        pass
+
+    def get_model_type(self) -> ModelType:
+        return ModelType.REALTIME
+
+    def is_gpt5(self) -> bool:
+        """Check if using GPT-5"""
+        return "gpt-5" in self.model.lower()
+
+    def get_model_version(self) -> str:
+        """Get model version (4, 5, etc.)"""
+        if "gpt-5" in self.model.lower():
+            return "5"
+        if "gpt-4" in self.model.lower():
+            return "4"
+        return "unknown"
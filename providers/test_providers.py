@@ -4,172 +4,217 @@ Test script for Billy Bass providers
 
 Usage:
     python test_providers.py ollama
-    python test_providers.py kobold  
+    python test_providers.py kobold
     python test_providers.py chatterai
     python test_providers.py openai
+    python test_providers.py all   (or no argument: every provider at once)
 """
 
 import asyncio
-import sys
+import logging
 import os
+import sys
+
 
 # Add the project root to path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from core.loop import run_event_loop
 from providers.factory import ProviderFactory
+from providers.http_session import close_http_session
+
+
+def say(provider, *args):
+    """print() with a [provider] prefix, so concurrent tests stay readable"""
+    print(f"[{provider}]", *args, flush=True)
+
+
+async def save_audio(path, stream):
+    """Write streamed audio to ``path`` in a worker thread as chunks arrive"""
+    f = await asyncio.to_thread(open, path, 'wb', 1 << 20)
+    try:
+        async for chunk in stream:
+            await asyncio.to_thread(f.write, chunk)
+    finally:
+        await asyncio.to_thread(f.close)
+
 
 async def test_ollama():
     """Test Ollama provider"""
-    print("🔧 Testing Ollama provider...")
-    
+    say("ollama", "🔧 Testing Ollama provider...")
+
     config = {
         'provider': 'ollama',
         'api_url': 'http://localhost:11434',  # Change to your Ollama server
         'model': 'llama3.2:latest',
         'temperature': 0.7,
-        'max_tokens': 100
+        'max_tokens': 100,
     }
-    
+
     try:
         provider = await ProviderFactory.create_llm_provider(config)
         await provider.start_session()
         await provider.send_message("Hello! Tell me a short joke about fish.")
-        
-        print("🤖 Billy's response:")
+
         complete_response = ""
         async for chunk in provider.get_response_stream():
             if chunk["type"] == "text_delta":
-                print(chunk["text"], end="", flush=True)
                 complete_response += chunk["text"]
+                if chunk.get("done"):
+                    say("ollama", f"🤖 Billy's response: {complete_response}")
+                    say("ollama", "✅ Ollama test complete!")
+                    break
             elif chunk["type"] == "error":
-                print(f"\n❌ Error: {chunk['message']}")
-            elif chunk.get("done"):
-                print("\n✅ Ollama test complete!")
-                break
-                
+                say("ollama", f"❌ Error: {chunk['message']}")
+
         await provider.end_session()
-        
+
     except Exception as e:
-        print(f"❌ Ollama test failed: {e}")
+        say("ollama", f"❌ Ollama test failed: {e}")
+
 
 async def test_kobold():
     """Test Kobold provider"""
-    print("🔧 Testing Kobold provider...")
-    
+    say("kobold", "🔧 Testing Kobold provider...")
+
     config = {
         'provider': 'kobold',
         'api_url': 'http://localhost:5000',  # Change to your Kobold server
         'temperature': 0.7,
-        'max_tokens': 100
+        'max_tokens': 100,
     }
-    
+
     try:
         provider = await ProviderFactory.create_llm_provider(config)
         await provider.start_session()
         await provider.send_message("Hello! Tell me a short joke about fish.")
-        
-        print("🤖 Billy's response:")
+
+        complete_response = ""
         async for chunk in provider.get_response_stream():
-            if chunk["type"] == "text_complete":
-                print(chunk["text"])
-                print("✅ Kobold test complete!")
+            if chunk["type"] == "text_delta":
+                complete_response += chunk["text"]
+                if chunk.get("done"):
+                    say("kobold", f"🤖 Billy's response: {complete_response}")
+                    say("kobold", "✅ Kobold test complete!")
             elif chunk["type"] == "error":
-                print(f"❌ Error: {chunk['message']}")
-                
+                say("kobold", f"❌ Error: {chunk['message']}")
+
         await provider.end_session()
-        
+
     except Exception as e:
-        print(f"❌ Kobold test failed: {e}")
+        say("kobold", f"❌ Kobold test failed: {e}")
+
 
 async def test_chatterai():
     """Test ChatterAI voice provider"""
-    print("🔧 Testing ChatterAI voice provider...")
-    
+    say("chatterai", "🔧 Testing ChatterAI voice provider...")
+
     config = {
         'provider': 'chatterai',
         'api_url': 'http://localhost:8080',  # Change to your ChatterAI server
-        'api_key': 'your-api-key-here',      # Add your API key
-        'model': 'natural'
+        'api_key': 'your-api-key-here',  # Add your API key
+        'model': 'natural',
     }
-    
+
     try:
         provider = await ProviderFactory.create_voice_provider(config)
-        
-        audio_data = await provider.text_to_speech(
-            "Hello! I'm Billy Bass, and I'm testing my new ChatterAI voice!",
-            {"voice": "natural", "speed": 1.0}
-        )
-        
+
         # Save test audio
-        with open('test_chatterai.wav', 'wb') as f:
-            f.write(audio_data)
-        
-        print("✅ ChatterAI test complete! Audio saved to test_chatterai.wav")
-        
+        await save_audio(
+            'test_chatterai.wav',
+            provider.text_to_speech_stream(
+                "Hello! I'm Billy Bass, and I'm testing my new ChatterAI voice!",
+                {"voice": "natural", "speed": 1.0},
+            ),
+        )
+
+        say(
+            "chatterai", "✅ ChatterAI test complete! Audio saved to test_chatterai.wav"
+        )
+
     except Exception as e:
-        print(f"❌ ChatterAI test failed: {e}")
+        say("chatterai", f"❌ ChatterAI test failed: {e}")
+
 
 async def test_openai():
     """Test OpenAI providers"""
-    print("🔧 Testing OpenAI providers...")
-    
+    say("openai", "🔧 Testing OpenAI providers...")
+
     # Test LLM
     llm_config = {
         'provider': 'openai',
         'api_key': 'sk-your-key-here',  # Add your OpenAI API key
-        'model': 'gpt-4o-mini-realtime-preview'
+        'model': 'gpt-4o-mini-realtime-preview',
     }
-    
-    # Test Voice  
+
+    # Test Voice
     voice_config = {
         'provider': 'openai',
         'api_key': 'sk-your-key-here',  # Add your OpenAI API key
-        'model': 'tts-1'
+        'model': 'tts-1',
+        'response_format': 'wav',  # Saved to a .wav file below
     }
-    
+
     try:
         # Test LLM
-        print("Testing OpenAI LLM...")
+        say("openai", "Testing OpenAI LLM...")
         llm_provider = await ProviderFactory.create_llm_provider(llm_config)
-        print("✅ OpenAI LLM provider initialized")
-        
+        say("openai", "✅ OpenAI LLM provider initialized")
+
         # Test Voice
-        print("Testing OpenAI Voice...")
+        say("openai", "Testing OpenAI Voice...")
         voice_provider = await ProviderFactory.create_voice_provider(voice_config)
-        
-        audio_data = await voice_provider.text_to_speech(
-            "Hello! I'm Billy Bass with OpenAI voice!",
-            {"voice": "ash", "speed": 1.0}
+
+        await save_audio(
+            'test_openai.wav',
+            voice_provider.text_to_speech_stream(
+                "Hello! I'm Billy Bass with OpenAI voice!",
+                {"voice": "ash", "speed": 1.0},
+            ),
         )
-        
-        with open('test_openai.wav', 'wb') as f:
-            f.write(audio_data)
-        
-        print("✅ OpenAI test complete! Audio saved to test_openai.wav")
-        
+
+        say("openai", "✅ OpenAI test complete! Audio saved to test_openai.wav")
+
     except Exception as e:
-        print(f"❌ OpenAI test failed: {e}")
+        say("openai", f"❌ OpenAI test failed: {e}")
+
 
 async def main():
     """Main test function"""
-    if len(sys.argv) != 2:
-        print("Usage: python test_providers.py <provider>")
-        print("Providers: ollama, kobold, chatterai, openai")
+    if len(sys.argv) > 2:
+        print("Usage: python test_providers.py [provider]")
+        print("Providers: ollama, kobold, chatterai, openai, all (default)")
         return
-    
-    provider = sys.argv[1].lower()
-    
-    if provider == 'ollama':
-        await test_ollama()
-    elif provider == 'kobold':
-        await test_kobold()
-    elif provider == 'chatterai':
-        await test_chatterai()
-    elif provider == 'openai':
-        await test_openai()
-    else:
-        print(f"❌ Unknown provider: {provider}")
-        print("Available: ollama, kobold, chatterai, openai")
+
+    provider = sys.argv[1].lower() if len(sys.argv) == 2 else 'all'
+
+    try:
+        if provider == 'all':
+            # The tests mostly wait on their servers, so run them side by side
+            await asyncio.gather(
+                test_ollama(),
+                test_kobold(),
+                test_chatterai(),
+                test_openai(),
+                return_exceptions=True,
+            )
+        elif provider == 'ollama':
+            await test_ollama()
+        elif provider == 'kobold':
+            await test_kobold()
+        elif provider == 'chatterai':
+            await test_chatterai()
+        elif provider == 'openai':
+            await test_openai()
+        else:
+            print(f"❌ Unknown provider: {provider}")
+            print("Available: ollama, kobold, chatterai, openai, all")
+    finally:
+        await close_http_session()
+
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    # Show the providers' log messages alongside the test output
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    # Same loop as the assistant: uvloop where it is installed
+    run_event_loop(main())
@@ -5,16 +5,38 @@ Voice synthesis providers for Billy Bass:
 - OpenAI: TTS-1, TTS-1-HD with latest voices
 - ChatterAI: External ChatterAI server
 - XTT: External XTT/Coqui server
+
+All of them send requests through the one aiohttp session from
+providers.http_session.get_http_session(), shared with the LLM providers, so
+switching or failing over between them keeps its connections warm.
+
+The providers are plain asyncio/aiohttp code and run noticeably faster on
+uvloop; core.loop.run_event_loop() uses it whenever it is installed.
 """
 
+import importlib
+
 from .base_voice import VoiceProvider
-from .openai_voice import OpenAIVoiceProvider
-from .chatterai_voice import ChatterAIVoiceProvider
-from .xtt_voice import XTTVoiceProvider
+
+
+# Concrete providers are imported on first access (PEP 562), so importing the
+# package doesn't load every provider's dependencies
+_PROVIDER_MODULES = {
+    'OpenAIVoiceProvider': '.openai_voice',
+    'ChatterAIVoiceProvider': '.chatterai_voice',
+    'XTTVoiceProvider': '.xtt_voice',
+}
+
+
+def __getattr__(name):
+    if name not in _PROVIDER_MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(_PROVIDER_MODULES[name], __name__), name)
+
 
 __all__ = [
-    'VoiceProvider',
+    'ChatterAIVoiceProvider',
     'OpenAIVoiceProvider',
-    'ChatterAIVoiceProvider', 
-    'XTTVoiceProvider'
-]
\ No newline at end of file
+    'VoiceProvider',
+    'XTTVoiceProvider',
+]
@@ -1,20 +1,125 @@
+import gzip
+import logging
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+
+from .. import jsonutil
+from ..http_session import read_error_text, read_http2_error_text
+
+
+logger = logging.getLogger(__name__)
+
+# Read size for streamed TTS response bodies
+STREAM_CHUNK_BYTES = 64 * 1024
+
+# Request bodies smaller than this aren't worth gzipping
+GZIP_MIN_BYTES = 512
+
+
+async def join_audio(stream: AsyncIterable[bytes]) -> bytes:
+    """Collect a streamed audio body into one bytes object
+
+    Chunks are appended to a bytearray as they arrive, and copied into bytes
+    once at the end.
+    """
+    buf = bytearray()
+    async for chunk in stream:
+        buf += chunk
+    return bytes(buf)
+
 
 class VoiceProvider(ABC):
     """Abstract base class for all voice synthesis providers"""
-    
+
+    # Config keys that must be set for ProviderFactory.validate_voice_config()
+    REQUIRED_CONFIG_KEYS: tuple[str, ...] = ()
+
+    # Name used in log messages
+    DISPLAY_NAME = "Voice"
+
+    # Set by providers that send TTS requests over HTTP/2 (see _post_tts)
+    _http2_client = None
+
+    # Set by providers whose server accepts gzipped request bodies (see _post_tts)
+    _gzip_headers = None
+
     @abstractmethod
-    async def initialize(self, config: Dict) -> bool:
+    async def initialize(self, config: dict) -> bool:
         """Initialize the voice provider with configuration"""
         pass
-    
+
     @abstractmethod
-    async def text_to_speech(self, text: str, voice_params: Dict) -> bytes:
+    async def text_to_speech(self, text: str, voice_params: dict) -> bytes:
         """Convert text to audio bytes"""
         pass
-    
+
+    async def text_to_speech_stream(
+        self, text: str, voice_params: dict
+    ) -> AsyncIterator[bytes]:
+        """Yield audio bytes as they are synthesized
+
+        Providers that can stream override this; the default yields the whole
+        text_to_speech() result at once.
+        """
+        yield await self.text_to_speech(text, voice_params)
+
+    async def _post_tts(self, path: str, payload: dict) -> AsyncIterator[bytes]:
+        """POST a TTS request to ``api_url + path`` and stream the audio body
+
+        For HTTP providers, which set api_url, _session, _json_headers and
+        _validated in initialize(), and optionally _http2_client and
+        _gzip_headers. Responses are decompressed by the HTTP client.
+        """
+        name = self.DISPLAY_NAME
+        url = f"{self.api_url}{path}"
+        body = jsonutil.dumps(payload)
+        headers = self._json_headers
+        if self._gzip_headers is not None and len(body) > GZIP_MIN_BYTES:
+            body = gzip.compress(body)
+            headers = self._gzip_headers
+        send = (
+            self._stream_http2 if self._http2_client is not None else self._stream_http1
+        )
+        size = 0
+        async for chunk in send(url, body, headers):
+            if not self._validated:
+                self._validated = True
+                logger.info("✅ Connected to %s server at %s", name, self.api_url)
+            size += len(chunk)
+            yield chunk
+        logger.debug("🔊 %s generated %d bytes of audio", name, size)
+
+    async def _stream_http1(
+        self, url: str, body: bytes, headers: Mapping[str, str]
+    ) -> AsyncIterator[bytes]:
+        async with self._session.post(url, data=body, headers=headers) as resp:
+            if resp.status != 200:
+                error_text = await read_error_text(resp)
+                raise Exception(
+                    f"{self.DISPLAY_NAME} TTS error {resp.status}: {error_text}"
+                )
+            async for chunk in resp.content.iter_chunked(STREAM_CHUNK_BYTES):
+                yield chunk
+
+    async def _stream_http2(
+        self, url: str, body: bytes, headers: Mapping[str, str]
+    ) -> AsyncIterator[bytes]:
+        async with self._http2_client.stream(
+            "POST", url, content=body, headers=headers
+        ) as resp:
+            if resp.status_code != 200:
+                error_text = await read_http2_error_text(resp)
+                raise Exception(
+                    f"{self.DISPLAY_NAME} TTS error {resp.status_code}: {error_text}"
+                )
+            async for chunk in resp.aiter_bytes(STREAM_CHUNK_BYTES):
+                yield chunk
+
+    async def aclose(self) -> None:
+        """Release any resources held by the provider"""
+        pass
+
     @abstractmethod
-    def get_supported_voices(self) -> List[str]:
-        """Get list of available voices"""
-        pass
\ No newline at end of file
+    def get_supported_voices(self) -> tuple[str, ...]:
+        """Get the available voices"""
+        pass
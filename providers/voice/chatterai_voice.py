@@ -1,86 +1,115 @@
+import logging
+from collections.abc import AsyncIterator
+
 import aiohttp
-from typing import Dict, List
-from .base_voice import VoiceProvider
+from multidict import CIMultiDictProxy
+
+from .. import jsonutil
+from ..http_session import (
+    JSON_HEADERS,
+    frozen_headers,
+    get_http_session,
+    read_error_text,
+)
+from .base_voice import VoiceProvider, join_audio
+
+
+logger = logging.getLogger(__name__)
+
+# Voices offered by stock ChatterAI servers
+_CHATTERAI_VOICES = (
+    "natural",
+    "expressive",
+    "calm",
+    "energetic",
+    "professional",
+    "friendly",
+)
+
 
 class ChatterAIVoiceProvider(VoiceProvider):
     """Client-only ChatterAI provider - connects to external ChatterAI server"""
-    
+
+    DISPLAY_NAME = "ChatterAI"
+    REQUIRED_CONFIG_KEYS = ('api_url',)
+
     def __init__(self):
         self.api_url = None
         self.api_key = None
         self.model = "natural"
-    
-    async def initialize(self, config: Dict) -> bool:
+        self._session: aiohttp.ClientSession | None = None
+        self._auth_headers: CIMultiDictProxy = frozen_headers({})
+        self._json_headers: CIMultiDictProxy = JSON_HEADERS
+        self._voices_cache: tuple[str, ...] | None = None  # Filled by refresh_voices()
+        self._validated = False  # Set once a TTS request has succeeded
+
+    async def initialize(self, config: dict) -> bool:
         """Initialize connection to external ChatterAI server"""
         self.api_url = config.get('api_url', 'https://api.chatterai.com')
         self.api_key = config.get('api_key')
         self.model = config.get('model', 'natural')
-        
+
         if not self.api_key:
-            print("❌ ChatterAI API key not provided")
-            return False
-        
-        # Test connection to ChatterAI server
-        try:
-            headers = {'Authorization': f'Bearer {self.api_key}'}
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}/api/v1/voices", 
-                    headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        voices_data = await resp.json()
-                        available_voices = voices_data.get('voices', [])
-                        print(f"✅ Connected to ChatterAI server at {self.api_url}")
-                        print(f"🔊 Available voices: {available_voices}")
-                        return True
-                    else:
-                        print(f"❌ ChatterAI server returned status {resp.status}")
-                        return False
-        except Exception as e:
-            print(f"❌ Failed to connect to ChatterAI server at {self.api_url}: {e}")
+            logger.error("❌ ChatterAI API key not provided")
             return False
-    
-    async def text_to_speech(self, text: str, voice_params: Dict) -> bytes:
+
+        # Built once; every request reuses the same read-only headers
+        headers = {'Authorization': f'Bearer {self.api_key}'}
+
+        self._auth_headers = frozen_headers(headers)
+        self._json_headers = frozen_headers(headers, 'application/json')
+        if config.get('gzip_requests'):
+            self._gzip_headers = frozen_headers(
+                {**headers, 'Content-Encoding': 'gzip'}, 'application/json'
+            )
+
+        # Pooled session shared with the other HTTP providers, so calls reuse sockets
+        self._session = await get_http_session()
+
+        # The server is checked by the first TTS request; the voice list is only
+        # fetched if something asks for it (refresh_voices)
+        logger.info("✅ ChatterAI voice provider using server at %s", self.api_url)
+        return True
+
+    async def refresh_voices(self) -> tuple[str, ...]:
+        """Fetch the voices offered by the ChatterAI server and cache them"""
+        async with self._session.get(
+            f"{self.api_url}/api/v1/voices", headers=self._auth_headers
+        ) as resp:
+            if resp.status != 200:
+                error_text = await read_error_text(resp)
+                raise Exception(f"ChatterAI voices error {resp.status}: {error_text}")
+            voices_data = jsonutil.loads(await resp.read())
+        self._voices_cache = tuple(voices_data.get('voices', ()))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🔊 Available voices: %s", ", ".join(map(str, self._voices_cache))
+            )
+        return self._voices_cache
+
+    async def text_to_speech(self, text: str, voice_params: dict) -> bytes:
         """Convert text to speech using external ChatterAI server"""
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
+        return await join_audio(self.text_to_speech_stream(text, voice_params))
+
+    def text_to_speech_stream(
+        self, text: str, voice_params: dict
+    ) -> AsyncIterator[bytes]:
+        """Stream speech from external ChatterAI server as it is synthesized"""
         payload = {
             'text': text,
             'voice': voice_params.get('voice', self.model),
             'speed': voice_params.get('speed', 1.0),
-            'format': 'wav'
+            'format': 'wav',
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/api/v1/tts",
-                    json=payload,
-                    headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        audio_data = await resp.read()
-                        print(f"🔊 ChatterAI generated {len(audio_data)} bytes of audio")
-                        return audio_data
-                    else:
-                        error_text = await resp.text()
-                        raise Exception(f"ChatterAI TTS error {resp.status}: {error_text}")
-                        
-        except Exception as e:
-            print(f"❌ ChatterAI TTS failed: {e}")
-            raise e
-    
-    def get_supported_voices(self) -> List[str]:
-        """Get list of supported ChatterAI voices"""
-        return [
-            "natural",
-            "expressive", 
-            "calm",
-            "energetic",
-            "professional",
-            "friendly"
-        ]
\ No newline at end of file
+        return self._post_tts("/api/v1/tts", payload)
+
+    async def aclose(self) -> None:
+        """Release the provider's HTTP session"""
+        # The shared HTTP session is closed by the assistant at shutdown
+        self._session = None
+
+    def get_supported_voices(self) -> tuple[str, ...]:
+        """Get the supported ChatterAI voices"""
+        if self._voices_cache is not None:
+            return self._voices_cache
+        return _CHATTERAI_VOICES
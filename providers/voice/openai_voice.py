@@ -1,109 +1,125 @@
+import logging
+from collections.abc import AsyncIterator
+
 import aiohttp
-from typing import Dict, List
-from .base_voice import VoiceProvider
+from multidict import CIMultiDictProxy
+
+from ..http_session import (
+    JSON_HEADERS,
+    frozen_headers,
+    get_http2_client,
+    get_http_session,
+)
+from .base_voice import VoiceProvider, join_audio
+
+
+logger = logging.getLogger(__name__)
+
+# Formats the playback pipeline can decode: raw 24 kHz mono PCM16, or the same
+# wrapped in a WAV header. Compressed formats (opus, mp3, ...) would need a decoder.
+_RESPONSE_FORMATS = ('pcm', 'wav')
+
+# Voices offered by the OpenAI TTS API
+_OPENAI_VOICES = (
+    "alloy",
+    "echo",
+    "fable",
+    "onyx",
+    "nova",
+    "shimmer",
+    "ash",  # New voices
+    "ballad",
+    "coral",
+    "sage",
+    "verse",
+)
+
 
 class OpenAIVoiceProvider(VoiceProvider):
     """OpenAI voice provider - maintains backward compatibility with existing Billy setup"""
-    
+
+    DISPLAY_NAME = "OpenAI"
+    REQUIRED_CONFIG_KEYS = ('api_key',)
+
     def __init__(self):
         self.api_key = None
         self.api_url = None
         self.model = "tts-1"
         self.organization = None
         self.project_id = None
-    
-    async def initialize(self, config: Dict) -> bool:
+        self.response_format = "pcm"
+        self._session: aiohttp.ClientSession | None = None
+        self._http2_client = None  # Shared httpx client when HTTP/2 is available
+        self._auth_headers: CIMultiDictProxy = frozen_headers({})
+        self._json_headers: CIMultiDictProxy = JSON_HEADERS
+        self._validated = False  # Set once a TTS request has succeeded
+
+    async def initialize(self, config: dict) -> bool:
         """Initialize OpenAI voice connection"""
         self.api_key = config.get('api_key')
-        self.api_url = config.get('api_url', 'https://api.openai.com/v1')
+        self.api_url = config.get('api_url') or 'https://api.openai.com/v1'
         self.model = config.get('model', 'tts-1')
         self.organization = config.get('organization')
         self.project_id = config.get('project_id')
-        
+        self.response_format = (config.get('response_format') or 'pcm').lower()
+
         if not self.api_key:
-            print("❌ OpenAI API key not provided for voice")
-            return False
-        
-        # Test OpenAI API access
-        try:
-            headers = {
-                'Authorization': f'Bearer {self.api_key}',
-                'Content-Type': 'application/json'
-            }
-            
-            if self.organization:
-                headers['OpenAI-Organization'] = self.organization
-            if self.project_id:
-                headers['OpenAI-Project'] = self.project_id
-            
-            # Simple API test (list models endpoint)
-            async with aiohttp.ClientSession() as session:
-                async with session.get(
-                    f"{self.api_url}/models",
-                    headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        print(f"✅ OpenAI voice provider initialized with model: {self.model}")
-                        return True
-                    else:
-                        print(f"❌ OpenAI API returned status {resp.status}")
-                        return False
-                        
-        except Exception as e:
-            print(f"❌ Failed to connect to OpenAI API: {e}")
+            logger.error("❌ OpenAI API key not provided for voice")
             return False
-    
-    async def text_to_speech(self, text: str, voice_params: Dict) -> bytes:
-        """Convert text to speech using OpenAI TTS API"""
-        headers = {
-            'Authorization': f'Bearer {self.api_key}',
-            'Content-Type': 'application/json'
-        }
-        
+
+        if self.response_format not in _RESPONSE_FORMATS:
+            logger.warning(
+                "⚠️  Unsupported TTS response format '%s', using pcm",
+                self.response_format,
+            )
+            self.response_format = 'pcm'
+
+        # Built once; every request reuses the same read-only headers
+        headers = {'Authorization': f'Bearer {self.api_key}'}
         if self.organization:
             headers['OpenAI-Organization'] = self.organization
         if self.project_id:
             headers['OpenAI-Project'] = self.project_id
-        
+
+        self._auth_headers = frozen_headers(headers)
+        self._json_headers = frozen_headers(headers, 'application/json')
+
+        # Pooled session shared with the other HTTP providers, so calls reuse sockets
+        self._session = await get_http_session()
+
+        # The OpenAI API speaks HTTP/2; with httpx[http2] installed, parallel
+        # sentences are multiplexed over one TLS connection
+        if self.api_url.startswith('https://'):
+            self._http2_client = get_http2_client()
+
+        # The key is validated by the first TTS request rather than an extra
+        # round-trip here
+        logger.info("✅ OpenAI voice provider initialized with model: %s", self.model)
+        return True
+
+    async def text_to_speech(self, text: str, voice_params: dict) -> bytes:
+        """Convert text to speech using OpenAI TTS API"""
+        return await join_audio(self.text_to_speech_stream(text, voice_params))
+
+    def text_to_speech_stream(
+        self, text: str, voice_params: dict
+    ) -> AsyncIterator[bytes]:
+        """Stream speech from OpenAI TTS API as it is synthesized"""
         payload = {
             'model': self.model,
             'input': text,
             'voice': voice_params.get('voice', 'ash'),
             'speed': voice_params.get('speed', 1.0),
-            'response_format': 'wav'
+            'response_format': self.response_format,
         }
-        
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.api_url}/audio/speech",
-                    json=payload,
-                    headers=headers
-                ) as resp:
-                    if resp.status == 200:
-                        audio_data = await resp.read()
-                        print(f"🔊 OpenAI generated {len(audio_data)} bytes of audio")
-                        return audio_data
-                    else:
-                        error_text = await resp.text()
-                        raise Exception(f"OpenAI TTS error {resp.status}: {error_text}")
-                        
-        except Exception as e:
-            print(f"❌ OpenAI TTS failed: {e}")
-            raise e
-    
-    def get_supported_voices(self) -> List[str]:
-        """Get list of supported OpenAI voices"""
-        return [
-            "alloy",
-            "echo", 
-            "fable",
-            "onyx",
-            "nova",
-            "shimmer",
-            "ash",      # New voices
-            "ballad",
-            "coral",
-            "sage",
-            "verse"
-        ]
\ No newline at end of file
+        return self._post_tts("/audio/speech", payload)
+
+    async def aclose(self) -> None:
+        """Release the provider's HTTP session"""
+        # The shared HTTP session is closed by the assistant at shutdown
+        self._session = None
+        self._http2_client = None
+
+    def get_supported_voices(self) -> tuple[str, ...]:
+        """Get the supported OpenAI voices"""
+        return _OPENAI_VOICES
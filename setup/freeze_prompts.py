@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""
+Freeze Billy's composed instructions into core/_instructions.py
+
+core.config imports the frozen literal instead of composing the prompt on every
+start, for as long as persona.ini and the prompt sources are unchanged. Run this
+again after editing persona.ini:
+
+    python3 setup/freeze_prompts.py
+"""
+
+import os
+import sys
+
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT_DIR)
+
+from core import config  # noqa: E402
+
+
+OUTPUT_PATH = os.path.join(ROOT_DIR, "core", "_instructions.py")
+
+
+def main():
+    with open(OUTPUT_PATH, "w") as f:
+        f.write("# Generated by setup/freeze_prompts.py - do not edit.\n")
+        f.write(f"__mtime__ = {config._instructions_mtime()!r}\n")
+        f.write(f"INSTRUCTIONS = {config._compose_instructions()!r}\n")
+    print(f"✅ Instructions frozen to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    main()